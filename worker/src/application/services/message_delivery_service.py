@@ -11,6 +11,9 @@ from ...domain.ports import ChannelType, SocialMediaPublisher, PublishRequest, P
 
 logger = structlog.get_logger()
 
+# Channel name -> ChannelType, avoids exception-driven enum lookups
+_PLATFORM_TO_CHANNEL: dict[str, ChannelType] = {c.value: c for c in ChannelType}
+
 
 class MessageDeliveryService:
     """
@@ -57,11 +60,11 @@ class MessageDeliveryService:
         # Convert channel strings to ChannelType enum
         channel_types = []
         for channel in channels:
-            try:
-                channel_types.append(ChannelType(channel.lower()))
-            except ValueError:
+            channel_type = _PLATFORM_TO_CHANNEL.get(channel.lower())
+            if channel_type is None:
                 logger.warning("Unknown channel type", channel=channel)
                 continue
+            channel_types.append(channel_type)
 
         if not channel_types:
             logger.error("No valid channels specified")
@@ -69,14 +72,14 @@ class MessageDeliveryService:
 
         request = PublishRequest(
             content=content,
-            channels=channel_types,
+            channels=tuple(channel_types),
             media_url=media_url,
             metadata=metadata,
         )
 
         logger.info(
             "Delivering message",
-            channels=[c.value for c in channel_types],
+            channels=channel_types,
             has_media=bool(media_url),
         )
 
@@ -1,18 +1,37 @@
+import asyncio
+import html
+
 import structlog
-from aiobotocore.session import get_session
+from aiobotocore.session import AioSession, get_session
 
 from .base import ChannelGateway, ChannelType, DeliveryResult
 
 logger = structlog.get_logger()
 
+# Bodies larger than this are built off the event loop
+LARGE_BODY_THRESHOLD = 64 * 1024
+
+
+def _build_html_body(content: str, media_url: str | None) -> str:
+    """Build the HTML email body, escaping user-provided values."""
+    parts = ["<p>", html.escape(content, quote=False), "</p>"]
+    if media_url:
+        parts.extend(['<p><img src="', html.escape(media_url), '" alt="Attached media" /></p>'])
+    return "".join(parts)
+
 
 class EmailGateway(ChannelGateway):
     """AWS SES email gateway."""
 
-    def __init__(self, sender_email: str, region: str = "us-east-1") -> None:
+    def __init__(
+        self,
+        sender_email: str,
+        region: str = "us-east-1",
+        session: AioSession | None = None,
+    ) -> None:
         self._sender_email = sender_email
         self._region = region
-        self._session = get_session()
+        self._session = session or get_session()
 
     @property
     def channel_type(self) -> ChannelType:
@@ -26,9 +45,11 @@ class EmailGateway(ChannelGateway):
     ) -> DeliveryResult:
         """Send an email via SES."""
         # Build HTML body with optional media
-        html_body = f"<p>{content}</p>"
-        if media_url:
-            html_body += f'<p><img src="{media_url}" alt="Attached media" /></p>'
+        if len(content) > LARGE_BODY_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            html_body = await loop.run_in_executor(None, _build_html_body, content, media_url)
+        else:
+            html_body = _build_html_body(content, media_url)
 
         try:
             async with self._session.create_client("ses", region_name=self._region) as client:
@@ -1,7 +1,9 @@
 import httpx
+import orjson
 import structlog
 
 from .base import ChannelGateway, ChannelType, DeliveryResult
+from .retry import RateLimiter, post_with_retry
 
 logger = structlog.get_logger()
 
@@ -11,9 +13,20 @@ class FacebookGateway(ChannelGateway):
 
     BASE_URL = "https://graph.facebook.com/v18.0"
 
-    def __init__(self, access_token: str, page_id: str) -> None:
+    def __init__(
+        self,
+        access_token: str,
+        page_id: str,
+        client: httpx.AsyncClient | None = None,
+        rate_limit: float = 0.0,
+    ) -> None:
         self._access_token = access_token
         self._page_id = page_id
+        # Access token is a query parameter on every Graph API call
+        self._params = {"access_token": access_token}
+        self._client = client or httpx.AsyncClient()
+        # Max requests per second (0 = unlimited)
+        self._limiter = RateLimiter(rate_limit) if rate_limit else None
 
     @property
     def channel_type(self) -> ChannelType:
@@ -28,10 +41,7 @@ class FacebookGateway(ChannelGateway):
         """Post to Facebook Page."""
         url = f"{self.BASE_URL}/{self._page_id}/feed"
 
-        payload = {
-            "message": content,
-            "access_token": self._access_token,
-        }
+        payload = {"message": content}
 
         if media_url:
             # For photo posts, use /photos endpoint
@@ -41,15 +51,20 @@ class FacebookGateway(ChannelGateway):
             del payload["message"]
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, data=payload)
-                response.raise_for_status()
-                data = response.json()
+            response = await post_with_retry(
+                self._client,
+                url,
+                self._limiter,
+                params=self._params,
+                data=payload,
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
-                post_id = data.get("id") or data.get("post_id")
-                logger.info("Facebook post created", post_id=post_id)
+            post_id = data.get("id") or data.get("post_id")
+            logger.info("Facebook post created", post_id=post_id)
 
-                return DeliveryResult(success=True, external_id=post_id)
+            return DeliveryResult(success=True, external_id=post_id)
 
         except httpx.HTTPStatusError as e:
             error_msg = f"Facebook API error: {e.response.status_code}"
@@ -1,19 +1,42 @@
+import hashlib
+import time
+from collections import OrderedDict
+
 import httpx
+import orjson
 import structlog
 
 from .base import ChannelGateway, ChannelType, DeliveryResult
+from .retry import RateLimiter, post_with_retry
 
 logger = structlog.get_logger()
 
+# Instagram media containers expire 24 hours after creation
+CONTAINER_TTL_SECONDS = 24 * 60 * 60
+
+# Unpublished containers kept for reuse; least recently used dropped first
+CONTAINER_CACHE_SIZE = 256
+
 
 class InstagramGateway(ChannelGateway):
     """Instagram Graph API gateway for content publishing."""
 
     BASE_URL = "https://graph.facebook.com/v18.0"
 
-    def __init__(self, access_token: str, instagram_account_id: str) -> None:
+    def __init__(
+        self,
+        access_token: str,
+        instagram_account_id: str,
+        client: httpx.AsyncClient | None = None,
+        rate_limit: float = 0.0,
+    ) -> None:
         self._access_token = access_token
         self._account_id = instagram_account_id
+        self._client = client or httpx.AsyncClient()
+        # Max requests per second (0 = unlimited)
+        self._limiter = RateLimiter(rate_limit) if rate_limit else None
+        # Unpublished container IDs keyed by media hash -> (container_id, created_at)
+        self._container_cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
 
     @property
     def channel_type(self) -> ChannelType:
@@ -32,33 +55,33 @@ class InstagramGateway(ChannelGateway):
                 error="Instagram posts require a media URL",
             )
 
+        cache_key = self._container_key(media_url, content)
+
         try:
-            async with httpx.AsyncClient() as client:
-                # Step 1: Create media container
-                container_url = f"{self.BASE_URL}/{self._account_id}/media"
-                container_payload = {
-                    "image_url": media_url,
-                    "caption": content,
-                    "access_token": self._access_token,
-                }
-
-                response = await client.post(container_url, data=container_payload)
-                response.raise_for_status()
-                container_id = response.json().get("id")
-
-                # Step 2: Publish the container
-                publish_url = f"{self.BASE_URL}/{self._account_id}/media_publish"
-                publish_payload = {
-                    "creation_id": container_id,
-                    "access_token": self._access_token,
-                }
-
-                response = await client.post(publish_url, data=publish_payload)
-                response.raise_for_status()
-                post_id = response.json().get("id")
-
-                logger.info("Instagram post published", post_id=post_id)
-                return DeliveryResult(success=True, external_id=post_id)
+            # Step 1: Reuse a live media container or create a new one
+            container_id = self._get_cached_container(cache_key)
+            from_cache = container_id is not None
+            if not from_cache:
+                container_id = await self._create_container(content, media_url)
+                self._cache_container(cache_key, container_id)
+
+            # Step 2: Publish the container
+            try:
+                post_id = await self._publish_container(container_id)
+            except httpx.HTTPStatusError:
+                if not from_cache:
+                    raise
+                # Cached container expired or was consumed, retry from step 1
+                logger.info("Instagram container stale, recreating", container_id=container_id)
+                container_id = await self._create_container(content, media_url)
+                self._cache_container(cache_key, container_id)
+                post_id = await self._publish_container(container_id)
+
+            # Published containers cannot be published again
+            self._container_cache.pop(cache_key, None)
+
+            logger.info("Instagram post published", post_id=post_id)
+            return DeliveryResult(success=True, external_id=post_id)
 
         except httpx.HTTPStatusError as e:
             error_msg = f"Instagram API error: {e.response.status_code}"
@@ -68,3 +91,66 @@ class InstagramGateway(ChannelGateway):
         except Exception as e:
             logger.error("Instagram delivery failed", error=str(e))
             return DeliveryResult(success=False, error=str(e))
+
+    async def _create_container(self, content: str, media_url: str) -> str:
+        """Create a media container and return its ID."""
+        container_url = f"{self.BASE_URL}/{self._account_id}/media"
+        container_payload = {
+            "image_url": media_url,
+            "caption": content,
+            "access_token": self._access_token,
+        }
+
+        response = await post_with_retry(
+            self._client,
+            container_url,
+            self._limiter,
+            data=container_payload,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content).get("id")
+
+    async def _publish_container(self, container_id: str) -> str:
+        """Publish a media container and return the post ID."""
+        publish_url = f"{self.BASE_URL}/{self._account_id}/media_publish"
+        publish_payload = {
+            "creation_id": container_id,
+            "access_token": self._access_token,
+        }
+
+        response = await post_with_retry(
+            self._client,
+            publish_url,
+            self._limiter,
+            data=publish_payload,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content).get("id")
+
+    def _get_cached_container(self, cache_key: str) -> str | None:
+        """Return a cached container ID if it has not expired."""
+        cached = self._container_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        container_id, created_at = cached
+        if time.monotonic() - created_at >= CONTAINER_TTL_SECONDS:
+            del self._container_cache[cache_key]
+            return None
+        self._container_cache.move_to_end(cache_key)
+        return container_id
+
+    def _cache_container(self, cache_key: str, container_id: str) -> None:
+        """Cache a container ID, evicting the least recently used past the cap."""
+        self._container_cache[cache_key] = (container_id, time.monotonic())
+        self._container_cache.move_to_end(cache_key)
+        if len(self._container_cache) > CONTAINER_CACHE_SIZE:
+            self._container_cache.popitem(last=False)
+
+    @staticmethod
+    def _container_key(media_url: str, caption: str) -> str:
+        """Hash media URL and caption (both are baked into the container)."""
+        digest = hashlib.blake2b(media_url.encode(), digest_size=16)
+        digest.update(b"\x00")
+        digest.update(caption.encode())
+        return digest.hexdigest()
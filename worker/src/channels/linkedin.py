@@ -1,7 +1,9 @@
 import httpx
+import orjson
 import structlog
 
 from .base import ChannelGateway, ChannelType, DeliveryResult
+from .retry import RateLimiter, post_with_retry
 
 logger = structlog.get_logger()
 
@@ -11,9 +13,26 @@ class LinkedInGateway(ChannelGateway):
 
     BASE_URL = "https://api.linkedin.com/v2"
 
-    def __init__(self, access_token: str, organization_id: str) -> None:
+    def __init__(
+        self,
+        access_token: str,
+        organization_id: str,
+        client: httpx.AsyncClient | None = None,
+        rate_limit: float = 0.0,
+    ) -> None:
         self._access_token = access_token
         self._organization_id = organization_id
+        # Recompute on token rotation, never per send
+        self._auth_header = f"Bearer {access_token}"
+        # Sent per request: the client may be shared with other gateways
+        self._headers = {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json",
+            "X-Restli-Protocol-Version": "2.0.0",
+        }
+        self._client = client or httpx.AsyncClient()
+        # Max requests per second (0 = unlimited)
+        self._limiter = RateLimiter(rate_limit) if rate_limit else None
 
     @property
     def channel_type(self) -> ChannelType:
@@ -26,12 +45,6 @@ class LinkedInGateway(ChannelGateway):
         media_url: str | None = None,
     ) -> DeliveryResult:
         """Post to LinkedIn Company Page."""
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "Content-Type": "application/json",
-            "X-Restli-Protocol-Version": "2.0.0",
-        }
-
         # Build the share content
         share_content = {
             "author": f"urn:li:organization:{self._organization_id}",
@@ -60,19 +73,20 @@ class LinkedInGateway(ChannelGateway):
             )
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/ugcPosts",
-                    headers=headers,
-                    json=share_content,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await post_with_retry(
+                self._client,
+                f"{self.BASE_URL}/ugcPosts",
+                self._limiter,
+                json=share_content,
+                headers=self._headers,
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
-                post_id = data.get("id")
-                logger.info("LinkedIn post created", post_id=post_id)
+            post_id = data.get("id")
+            logger.info("LinkedIn post created", post_id=post_id)
 
-                return DeliveryResult(success=True, external_id=post_id)
+            return DeliveryResult(success=True, external_id=post_id)
 
         except httpx.HTTPStatusError as e:
             error_msg = f"LinkedIn API error: {e.response.status_code}"
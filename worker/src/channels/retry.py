@@ -0,0 +1,110 @@
+"""
+Rate limiting and throttling retries for HTTP channel gateways.
+
+Only throttling responses are retried: they mean the platform did not
+act on the request, so resending cannot create a duplicate post.
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+# Attempts per request, including the first
+MAX_ATTEMPTS = 3
+
+# Backoff before retry n (0-based) is min(MAX_DELAY, BASE_DELAY * 2**n)
+BASE_DELAY = 0.5
+MAX_DELAY = 8.0
+
+# Statuses that always mean "throttled, try again later"
+THROTTLE_STATUSES = frozenset({429, 503})
+
+# Meta and LinkedIn also report throttling as 400/403 with these in the body
+_THROTTLE_MARKERS = (b"rate limit", b"quota", b"limit reached")
+
+
+class RateLimiter:
+    """Spaces calls at least 1 / rate seconds apart."""
+
+    __slots__ = ("_lock", "_min_interval", "_next_call")
+
+    def __init__(self, rate: float) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Maximum calls per second
+        """
+        self._min_interval = 1.0 / rate
+        self._next_call = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait until the next call is allowed."""
+        async with self._lock:
+            delay = self._next_call - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_call = time.monotonic() + self._min_interval
+
+
+def is_throttled(response: httpx.Response) -> bool:
+    """Whether a response reports rate limiting."""
+    status = response.status_code
+    if status in THROTTLE_STATUSES:
+        return True
+    if status in (400, 403):
+        body = response.content.lower()
+        return any(marker in body for marker in _THROTTLE_MARKERS)
+    return False
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Backoff before retrying, honouring a numeric Retry-After header."""
+    delay = BASE_DELAY * 2**attempt
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        delay = float(retry_after)
+    return min(MAX_DELAY, delay)
+
+
+async def post_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    limiter: RateLimiter | None = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """
+    POST, retrying throttled responses with exponential backoff.
+
+    Args:
+        client: HTTP client
+        url: Request URL
+        limiter: Optional rate limiter applied to every attempt
+        **kwargs: Passed to client.post
+
+    Returns:
+        The first non-throttled response, or the last one once attempts
+        run out (callers still call raise_for_status)
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        if limiter is not None:
+            await limiter.wait()
+        response = await client.post(url, **kwargs)
+        if attempt == MAX_ATTEMPTS - 1 or not is_throttled(response):
+            return response
+
+        delay = _retry_delay(response, attempt)
+        logger.warning(
+            "Channel API throttled, retrying",
+            status=response.status_code,
+            attempt=attempt + 1,
+            delay=delay,
+        )
+        await asyncio.sleep(delay)
+    return response
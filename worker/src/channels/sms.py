@@ -1,5 +1,9 @@
+import asyncio
+from typing import Any
+
 import structlog
-from aiobotocore.session import get_session
+from aiobotocore.session import AioSession, get_session
+from botocore.exceptions import BotoCoreError, ClientError
 
 from .base import ChannelGateway, ChannelType, DeliveryResult
 
@@ -9,10 +13,15 @@ logger = structlog.get_logger()
 class SmsGateway(ChannelGateway):
     """AWS SNS SMS gateway."""
 
-    def __init__(self, sender_id: str = "", region: str = "us-east-1") -> None:
+    def __init__(
+        self,
+        sender_id: str = "",
+        region: str = "us-east-1",
+        session: AioSession | None = None,
+    ) -> None:
         self._sender_id = sender_id
         self._region = region
-        self._session = get_session()
+        self._session = session or get_session()
 
     @property
     def channel_type(self) -> ChannelType:
@@ -25,29 +34,59 @@ class SmsGateway(ChannelGateway):
         media_url: str | None = None,  # Not supported for SMS
     ) -> DeliveryResult:
         """Send an SMS via SNS."""
+        return (await self.send_many([recipient_id], content, media_url))[0]
+
+    async def send_many(
+        self,
+        recipients: list[str],
+        content: str,
+        media_url: str | None = None,
+        concurrency: int = 50,
+    ) -> list[DeliveryResult]:
+        """
+        Send an SMS to several recipients over one SNS client.
+
+        SNS PublishBatch only targets topics, so direct-to-phone messages
+        are still one Publish each; they share the client's connection pool.
+        """
         if media_url:
             content += f"\n\nMedia: {media_url}"
 
         try:
             async with self._session.create_client("sns", region_name=self._region) as client:
-                params = {
-                    "PhoneNumber": recipient_id,
-                    "Message": content,
-                }
+                sem = asyncio.Semaphore(concurrency)
 
-                if self._sender_id:
-                    params["MessageAttributes"] = {
-                        "AWS.SNS.SMS.SenderID": {
-                            "DataType": "String",
-                            "StringValue": self._sender_id,
-                        }
-                    }
+                async def publish_one(recipient_id: str) -> DeliveryResult:
+                    async with sem:
+                        return await self._publish(client, recipient_id, content)
 
-                response = await client.publish(**params)
-                message_id = response.get("MessageId")
+                return await asyncio.gather(*(publish_one(r) for r in recipients))
+
+        except (BotoCoreError, ClientError) as e:
+            logger.error("SMS delivery failed", error=str(e), recipients=len(recipients))
+            return [DeliveryResult(success=False, error=str(e)) for _ in recipients]
+
+    async def _publish(self, client: Any, recipient_id: str, content: str) -> DeliveryResult:
+        """Publish one SMS with an open SNS client."""
+        params = {
+            "PhoneNumber": recipient_id,
+            "Message": content,
+        }
+
+        if self._sender_id:
+            params["MessageAttributes"] = {
+                "AWS.SNS.SMS.SenderID": {
+                    "DataType": "String",
+                    "StringValue": self._sender_id,
+                }
+            }
+
+        try:
+            response = await client.publish(**params)
+            message_id = response.get("MessageId")
 
-                logger.info("SMS sent", message_id=message_id, recipient=recipient_id)
-                return DeliveryResult(success=True, external_id=message_id)
+            logger.info("SMS sent", message_id=message_id, recipient=recipient_id)
+            return DeliveryResult(success=True, external_id=message_id)
 
         except Exception as e:
             logger.error("SMS delivery failed", error=str(e), recipient=recipient_id)
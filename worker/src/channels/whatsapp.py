@@ -1,7 +1,9 @@
 import httpx
+import orjson
 import structlog
 
 from .base import ChannelGateway, ChannelType, DeliveryResult
+from .retry import RateLimiter, post_with_retry
 
 logger = structlog.get_logger()
 
@@ -11,9 +13,25 @@ class WhatsAppGateway(ChannelGateway):
 
     BASE_URL = "https://graph.facebook.com/v18.0"
 
-    def __init__(self, access_token: str, phone_number_id: str) -> None:
+    def __init__(
+        self,
+        access_token: str,
+        phone_number_id: str,
+        client: httpx.AsyncClient | None = None,
+        rate_limit: float = 0.0,
+    ) -> None:
         self._access_token = access_token
         self._phone_number_id = phone_number_id
+        # Recompute on token rotation, never per send
+        self._auth_header = f"Bearer {access_token}"
+        # Sent per request: the client may be shared with other Meta gateways
+        self._headers = {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json",
+        }
+        self._client = client or httpx.AsyncClient()
+        # Max requests per second (0 = unlimited)
+        self._limiter = RateLimiter(rate_limit) if rate_limit else None
 
     @property
     def channel_type(self) -> ChannelType:
@@ -27,10 +45,6 @@ class WhatsAppGateway(ChannelGateway):
     ) -> DeliveryResult:
         """Send a WhatsApp message."""
         url = f"{self.BASE_URL}/{self._phone_number_id}/messages"
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "Content-Type": "application/json",
-        }
 
         # Build message payload
         if media_url:
@@ -49,15 +63,20 @@ class WhatsAppGateway(ChannelGateway):
             }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-                data = response.json()
+            response = await post_with_retry(
+                self._client,
+                url,
+                self._limiter,
+                headers=self._headers,
+                json=payload,
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
-                message_id = data.get("messages", [{}])[0].get("id")
-                logger.info("WhatsApp message sent", message_id=message_id, recipient=recipient_id)
+            message_id = data.get("messages", [{}])[0].get("id")
+            logger.info("WhatsApp message sent", message_id=message_id, recipient=recipient_id)
 
-                return DeliveryResult(success=True, external_id=message_id)
+            return DeliveryResult(success=True, external_id=message_id)
 
         except httpx.HTTPStatusError as e:
             error_msg = f"WhatsApp API error: {e.response.status_code}"
@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     kinesis_stream_name: str = "secure-api-events"
     aws_region: str = "us-east-1"
     aws_endpoint_url: str | None = None  # For LocalStack
+    kinesis_checkpoint_table: str = ""  # DynamoDB table for shard checkpoints (empty = disabled)
 
     # Meta API (Facebook, Instagram, WhatsApp)
     meta_access_token: str = ""
@@ -37,9 +38,15 @@ class Settings(BaseSettings):
     # AWS SNS (SMS)
     sns_sender_id: str = ""
 
+    # Publishing
+    publisher_max_concurrency: int = 8  # Outstanding channel sends per publisher
+    channel_max_concurrency: int = 4  # Outstanding sends per channel gateway
+    channel_rate_limit: float = 0.0  # Requests per second per HTTP gateway (0 = unlimited)
+
     # AI Agent
     use_ai_agent: bool = False  # Enable AI agent for intelligent posting
     bedrock_model_id: str = "anthropic.claude-sonnet-4-5-20250929-v1:0"
+    bedrock_latency_optimized: bool = False  # Only where Bedrock supports it
 
     @property
     def database_url(self) -> str:
@@ -9,6 +9,7 @@ Following hexagonal architecture, dependencies are injected via constructor.
 
 import asyncio
 import json
+from contextlib import AsyncExitStack
 from typing import Any
 
 import structlog
@@ -16,11 +17,17 @@ from aiobotocore.session import get_session
 
 from .config import settings
 from .domain.ports import IdempotencyPort
-from .infrastructure.logging import set_correlation_id
+from .infrastructure.checkpoint import KinesisCheckpointer
 from .processor import MessageProcessor
 
 logger = structlog.get_logger()
 
+# Records buffered per shard before the poller waits on the processor
+SHARD_QUEUE_SIZE = 200
+
+# Queued records handed to the processor together
+PROCESS_BATCH_SIZE = 25
+
 
 class KinesisConsumer:
     """
@@ -47,6 +54,7 @@ class KinesisConsumer:
         self._idempotency = idempotency
         self._session = get_session()
         self._running = False
+        self._checkpointer: KinesisCheckpointer | None = None
 
     async def start(self) -> None:
         """Start consuming from Kinesis stream."""
@@ -61,12 +69,28 @@ class KinesisConsumer:
         if settings.aws_endpoint_url:
             client_kwargs["endpoint_url"] = settings.aws_endpoint_url
 
-        async with self._session.create_client("kinesis", **client_kwargs) as client:
+        async with AsyncExitStack() as stack:
+            client = await stack.enter_async_context(
+                self._session.create_client("kinesis", **client_kwargs)
+            )
+            if settings.kinesis_checkpoint_table:
+                dynamodb = await stack.enter_async_context(
+                    self._session.create_client("dynamodb", **client_kwargs)
+                )
+                self._checkpointer = KinesisCheckpointer(
+                    dynamodb,
+                    table_name=settings.kinesis_checkpoint_table,
+                    stream_name=settings.kinesis_stream_name,
+                )
+                # Registered last, so it runs before the clients are closed
+                stack.push_async_callback(self._checkpointer.flush)
+
             stream_desc = await client.describe_stream(StreamName=settings.kinesis_stream_name)
             shards = stream_desc["StreamDescription"]["Shards"]
 
-            tasks = [self._process_shard(client, shard["ShardId"]) for shard in shards]
-            await asyncio.gather(*tasks)
+            async with asyncio.TaskGroup() as tg:
+                for shard in shards:
+                    tg.create_task(self._process_shard(client, shard["ShardId"]))
 
     async def stop(self) -> None:
         """Stop the consumer."""
@@ -77,10 +101,37 @@ class KinesisConsumer:
         """Process records from a single shard."""
         logger.info("Processing shard", shard_id=shard_id)
 
+        # Bounded queue: a slow downstream gateway applies backpressure to the poller
+        queue: asyncio.Queue[dict | None] = asyncio.Queue(maxsize=SHARD_QUEUE_SIZE)
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._drain_shard_queue(shard_id, queue))
+            await self._poll_shard(client, shard_id, queue)
+            # Sentinel: let the drainer finish queued records, then exit
+            await queue.put(None)
+
+    async def _poll_shard(
+        self,
+        client: Any,
+        shard_id: str,
+        queue: asyncio.Queue[dict | None],
+    ) -> None:
+        """Poll a shard and enqueue its records for processing."""
+        iterator_kwargs = {"ShardIteratorType": "LATEST"}
+        if self._checkpointer:
+            sequence_number = await self._checkpointer.get_checkpoint(shard_id)
+            if sequence_number:
+                # Resume after the last checkpointed record
+                iterator_kwargs = {
+                    "ShardIteratorType": "AFTER_SEQUENCE_NUMBER",
+                    "StartingSequenceNumber": sequence_number,
+                }
+                logger.info("Resuming shard from checkpoint", shard_id=shard_id)
+
         iterator_response = await client.get_shard_iterator(
             StreamName=settings.kinesis_stream_name,
             ShardId=shard_id,
-            ShardIteratorType="LATEST",
+            **iterator_kwargs,
         )
         shard_iterator = iterator_response["ShardIterator"]
 
@@ -92,30 +143,87 @@ class KinesisConsumer:
                 )
 
                 for record in response.get("Records", []):
-                    await self._process_record(record)
+                    await queue.put(record)
 
                 shard_iterator = response.get("NextShardIterator")
 
                 if not response.get("Records"):
+                    if self._checkpointer:
+                        await self._checkpointer.flush_if_due()
                     await asyncio.sleep(1)
 
             except Exception as e:
                 logger.error("Error processing shard", shard_id=shard_id, error=str(e))
                 await asyncio.sleep(5)
 
-    async def _process_record(self, record: dict) -> None:
-        """Process a single Kinesis record with idempotency."""
+    async def _drain_shard_queue(
+        self,
+        shard_id: str,
+        queue: asyncio.Queue[dict | None],
+    ) -> None:
+        """Process queued records in batches until the poller stops."""
+        stopping = False
+        # Once a batch fails the shard's checkpoint stays before it, so a
+        # restart replays it; idempotency skips what completed since
+        checkpoint_held = False
+        while not stopping and (record := await queue.get()) is not None:
+            # Take whatever else is already queued, up to a batch
+            batch = [record]
+            while len(batch) < PROCESS_BATCH_SIZE and not queue.empty():
+                queued = queue.get_nowait()
+                if queued is None:
+                    stopping = True
+                    break
+                batch.append(queued)
+
+            if not await self._process_records(batch) and not checkpoint_held:
+                checkpoint_held = True
+                logger.warning(
+                    "Holding shard checkpoint after failed batch",
+                    shard_id=shard_id,
+                    sequence_number=batch[0]["SequenceNumber"],
+                )
+            if self._checkpointer and not checkpoint_held:
+                for processed in batch:
+                    await self._checkpointer.record(shard_id, processed["SequenceNumber"])
+
+    async def _process_records(self, records: list[dict]) -> bool:
+        """
+        Process a batch of Kinesis records with idempotency.
+
+        Returns:
+            False if the batch failed and its records must be replayed.
+            Records that are skipped (unknown or malformed) count as processed.
+        """
+        scheduled = [
+            parsed for record in records if (parsed := self._parse_record(record)) is not None
+        ]
+        if not scheduled:
+            return True
+
+        try:
+            await self._handle_scheduled_messages(scheduled)
+        except Exception as e:
+            logger.error("Error processing records", error=str(e), count=len(scheduled))
+            return False
+        return True
+
+    def _parse_record(self, record: dict) -> tuple[dict, str] | None:
+        """
+        Decode a record that schedules a message.
+
+        Returns:
+            The payload and its correlation ID, or None for other records.
+            Records are processed later as a batch, so the correlation ID
+            travels with the payload and is bound per message at delivery.
+        """
         try:
             data = json.loads(record["Data"].decode("utf-8"))
             event_type = data.get("event_type")
             payload = data.get("payload", {})
-
-            # Extract and set correlation ID for distributed tracing
             correlation_id = data.get("correlation_id", "")
-            if correlation_id:
-                set_correlation_id(correlation_id)
 
-            # Bind correlation ID to all logs in this record processing
+            # Bind correlation ID to the logs for this record
             with structlog.contextvars.bound_contextvars(
                 correlation_id=correlation_id,
                 event_type=event_type,
@@ -126,47 +234,61 @@ class KinesisConsumer:
                 )
 
                 if event_type == "message.scheduled":
-                    await self._handle_scheduled_message(payload)
-                else:
-                    logger.warning("Unknown event type")
+                    # Validate up front so one bad record can't fail the batch
+                    if "message_id" not in payload or "channels" not in payload:
+                        logger.error("Malformed scheduled message payload")
+                        return None
+                    return payload, correlation_id
+                logger.warning("Unknown event type")
 
         except json.JSONDecodeError as e:
             logger.error("Invalid JSON in record", error=str(e))
         except Exception as e:
             logger.error("Error processing record", error=str(e))
+        return None
 
-    async def _handle_scheduled_message(self, payload: dict) -> None:
-        """Handle a message.scheduled event."""
-        message_id = payload["message_id"]
-        channels = payload["channels"]
-
+    async def _handle_scheduled_messages(self, scheduled: list[tuple[dict, str]]) -> None:
+        """Handle a batch of message.scheduled events, each with its correlation ID."""
         # Security: Check idempotency to prevent duplicate processing
-        idempotency_key = self._idempotency.generate_key(message_id, channels)
-        existing = self._idempotency.check_and_lock(idempotency_key)
-
-        if existing:
-            if existing.status == "completed":
-                logger.info(
-                    "Skipping duplicate message (idempotent)",
-                    message_id=message_id,
-                )
-                return
-            elif existing.status == "processing":
-                logger.info(
-                    "Message already being processed",
-                    message_id=message_id,
-                )
-                return
+        keys = self._idempotency.generate_keys(
+            [(payload["message_id"], payload["channels"]) for payload, _ in scheduled]
+        )
+        existing_records = self._idempotency.check_and_lock_many(keys)
+
+        pending: list[tuple[dict, str, bytes]] = []
+        for (payload, correlation_id), key, existing in zip(scheduled, keys, existing_records):
+            if existing:
+                if existing.status == "completed":
+                    logger.info(
+                        "Skipping duplicate message (idempotent)",
+                        message_id=payload["message_id"],
+                    )
+                    continue
+                elif existing.status == "processing":
+                    logger.info(
+                        "Message already being processed",
+                        message_id=payload["message_id"],
+                    )
+                    continue
+            pending.append((payload, correlation_id, key))
+
+        if not pending:
+            return
 
         try:
-            await self._processor.process_scheduled_message(
-                message_id=message_id,
-                channels=channels,
-            )
-            self._idempotency.mark_completed(
-                idempotency_key,
-                {"message_id": message_id, "channels": channels},
+            await self._processor.process_scheduled_messages(
+                [
+                    (payload["message_id"], payload["channels"], correlation_id)
+                    for payload, correlation_id, _ in pending
+                ]
             )
         except Exception as e:
-            self._idempotency.mark_failed(idempotency_key, str(e))
+            for _, _, key in pending:
+                self._idempotency.mark_failed(key, str(e))
             raise
+
+        for payload, _, key in pending:
+            self._idempotency.mark_completed(
+                key,
+                {"message_id": payload["message_id"], "channels": payload["channels"]},
+            )
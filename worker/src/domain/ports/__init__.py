@@ -1,15 +1,22 @@
 from .channel_gateway import ChannelGateway, DeliveryResult, ChannelType
-from .content_filter import ContentFilter, ContentRisk, FilterResult, ViolationType
+from .content_filter import ContentFilter, ContentRisk, Direction, FilterResult, ViolationType
 from .idempotency import IdempotencyPort, IdempotencyRecord
 from .message_repository import MessageRepository, MessageData
-from .social_media_publisher import SocialMediaPublisher, PublishRequest, PublishResult
+from .social_media_publisher import (
+    ChannelOutcome,
+    SocialMediaPublisher,
+    PublishRequest,
+    PublishResult,
+)
 
 __all__ = [
     "ChannelGateway",
+    "ChannelOutcome",
     "ChannelType",
     "ContentFilter",
     "ContentRisk",
     "DeliveryResult",
+    "Direction",
     "FilterResult",
     "IdempotencyPort",
     "IdempotencyRecord",
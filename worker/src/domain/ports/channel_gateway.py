@@ -5,12 +5,13 @@ This is the interface that the domain/application layer uses to send messages.
 Infrastructure adapters implement this interface.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 
 
-class ChannelType(str, Enum):
+class ChannelType(StrEnum):
     """Supported delivery channels."""
 
     WHATSAPP = "whatsapp"
@@ -64,3 +65,33 @@ class ChannelGateway(ABC):
             DeliveryResult with success status and external ID
         """
         ...
+
+    async def send_many(
+        self,
+        recipients: list[str],
+        content: str,
+        media_url: str | None = None,
+        concurrency: int = 50,
+    ) -> list[DeliveryResult]:
+        """
+        Send the same message to several recipients.
+
+        The default sends concurrently, at most `concurrency` at a time.
+        Gateways whose API can batch should override this.
+
+        Args:
+            recipients: Target recipients
+            content: Message content
+            media_url: Optional media attachment URL
+            concurrency: Maximum sends in flight
+
+        Returns:
+            DeliveryResult per recipient, in order
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def send_one(recipient_id: str) -> DeliveryResult:
+            async with sem:
+                return await self.send(recipient_id, content, media_url)
+
+        return await asyncio.gather(*(send_one(r) for r in recipients))
@@ -5,12 +5,12 @@ Security: Provides guardrails for AI-generated content to prevent
 prompt injection, malicious content, and policy violations.
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
+from typing import Protocol
 
 
-class ContentRisk(Enum):
+class ContentRisk(StrEnum):
     """Risk levels for content moderation."""
 
     SAFE = "safe"
@@ -20,7 +20,7 @@ class ContentRisk(Enum):
     BLOCKED = "blocked"
 
 
-class ViolationType(Enum):
+class ViolationType(StrEnum):
     """Types of content policy violations."""
 
     PROMPT_INJECTION = "prompt_injection"
@@ -32,18 +32,29 @@ class ViolationType(Enum):
     OFF_TOPIC = "off_topic"
 
 
-@dataclass
+class Direction(StrEnum):
+    """Which side of the AI a piece of content is on."""
+
+    INPUT = "input"  # User content before it reaches the AI
+    OUTPUT = "output"  # AI-generated content before publishing
+
+
+@dataclass(slots=True, frozen=True)
 class FilterResult:
     """Result of content filtering."""
 
     is_safe: bool
     risk_level: ContentRisk
-    violations: list[ViolationType]
-    sanitized_content: str | None = None  # Cleaned version if available
+    violations: tuple[ViolationType, ...]
+    sanitized_content: str | None = None  # Cleaned version; None if content needed no cleaning
     reason: str | None = None
 
 
-class ContentFilter(ABC):
+# Shared result for clean content that needed no sanitizing
+SAFE_RESULT = FilterResult(is_safe=True, risk_level=ContentRisk.SAFE, violations=())
+
+
+class ContentFilter(Protocol):
     """
     Port for content filtering and moderation.
 
@@ -51,7 +62,6 @@ class ContentFilter(ABC):
     to prevent prompt injection and policy violations.
     """
 
-    @abstractmethod
     def filter_input(self, content: str) -> FilterResult:
         """
         Filter user input before sending to AI.
@@ -66,7 +76,6 @@ class ContentFilter(ABC):
         """
         ...
 
-    @abstractmethod
     def filter_output(self, content: str) -> FilterResult:
         """
         Filter AI-generated output before publishing.
@@ -81,3 +90,18 @@ class ContentFilter(ABC):
             FilterResult with safety assessment
         """
         ...
+
+    def filter_batch(self, items: list[tuple[str, Direction]]) -> list[FilterResult]:
+        """
+        Filter several pieces of content in one call.
+
+        Lets implementations share one scan across input and output
+        checks and skip duplicate content.
+
+        Args:
+            items: (content, direction) pairs
+
+        Returns:
+            FilterResult per item, in the same order
+        """
+        ...
@@ -5,17 +5,16 @@ This port defines the interface for idempotency operations.
 Implementations live in the infrastructure layer.
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Protocol
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IdempotencyRecord:
     """Record of a processed operation."""
 
-    key: str
+    key: bytes
     status: str  # processing, completed, failed
     created_at: datetime
     completed_at: datetime | None = None
@@ -23,7 +22,7 @@ class IdempotencyRecord:
     error: str | None = None
 
 
-class IdempotencyPort(ABC):
+class IdempotencyPort(Protocol):
     """
     Outbound port for idempotency checking.
 
@@ -31,8 +30,7 @@ class IdempotencyPort(ABC):
     duplicate operations without knowing about the storage mechanism.
     """
 
-    @abstractmethod
-    def generate_key(self, message_id: str, channels: list[str]) -> str:
+    def generate_key(self, message_id: str, channels: list[str]) -> bytes:
         """
         Generate a unique idempotency key.
 
@@ -41,12 +39,23 @@ class IdempotencyPort(ABC):
             channels: List of target channels
 
         Returns:
-            Unique key for this operation
+            Unique fixed-size binary key for this operation
         """
         ...
 
-    @abstractmethod
-    def check_and_lock(self, key: str) -> IdempotencyRecord | None:
+    def generate_keys(self, items: list[tuple[str, list[str]]]) -> list[bytes]:
+        """
+        Generate idempotency keys for a batch of messages.
+
+        Args:
+            items: (message_id, channels) per message
+
+        Returns:
+            Keys matching generate_key, in input order
+        """
+        ...
+
+    def check_and_lock(self, key: bytes) -> IdempotencyRecord | None:
         """
         Check if operation exists and lock if not.
 
@@ -58,8 +67,22 @@ class IdempotencyPort(ABC):
         """
         ...
 
-    @abstractmethod
-    def mark_completed(self, key: str, result: dict[str, Any]) -> None:
+    def check_and_lock_many(self, keys: list[bytes]) -> list[IdempotencyRecord | None]:
+        """
+        Check and lock several operations in one call.
+
+        Lets storage backends batch the round-trips (e.g. a pipeline of
+        SET NX commands).
+
+        Args:
+            keys: Idempotency keys
+
+        Returns:
+            Existing record or None (new and locked) per key, in order
+        """
+        ...
+
+    def mark_completed(self, key: bytes, result: dict[str, Any]) -> None:
         """
         Mark operation as completed.
 
@@ -69,8 +92,7 @@ class IdempotencyPort(ABC):
         """
         ...
 
-    @abstractmethod
-    def mark_failed(self, key: str, error: str) -> None:
+    def mark_failed(self, key: bytes, error: str) -> None:
         """
         Mark operation as failed.
 
@@ -5,13 +5,15 @@ This port defines the interface for message storage operations.
 Implementations live in the infrastructure layer.
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Protocol
 from uuid import UUID
 
+from .social_media_publisher import ChannelOutcome
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MessageData:
     """Domain representation of a message."""
 
@@ -25,7 +27,7 @@ class MessageData:
     updated_at: datetime | None = None
 
 
-class MessageRepository(ABC):
+class MessageRepository(Protocol):
     """
     Outbound port for message persistence.
 
@@ -33,60 +35,35 @@ class MessageRepository(ABC):
     without knowing about the underlying storage mechanism.
     """
 
-    @abstractmethod
-    async def get_by_id(self, message_id: UUID) -> MessageData | None:
+    async def get_by_ids(self, message_ids: list[UUID]) -> dict[UUID, MessageData]:
         """
-        Retrieve a message by its ID.
+        Retrieve several messages at once.
 
         Args:
-            message_id: UUID of the message
+            message_ids: UUIDs of the messages
 
         Returns:
-            MessageData if found, None otherwise
+            Found messages keyed by ID; missing IDs are absent
         """
         ...
 
-    @abstractmethod
-    async def update_status(self, message_id: UUID, status: str) -> None:
-        """
-        Update the status of a message.
-
-        Args:
-            message_id: UUID of the message
-            status: New status (pending, processing, delivered, partial, failed)
-        """
-        ...
-
-    @abstractmethod
-    async def mark_channel_delivered(
-        self,
-        message_id: UUID,
-        channel: str,
-        external_id: str | None = None,
-    ) -> None:
+    async def bulk_update_status(self, statuses: dict[UUID, str]) -> None:
         """
-        Mark a channel delivery as successful.
+        Update the status of several messages at once.
 
         Args:
-            message_id: UUID of the message
-            channel: Channel name (facebook, instagram, etc.)
-            external_id: External ID from the channel (post ID, etc.)
+            statuses: New status per message ID
         """
         ...
 
-    @abstractmethod
-    async def mark_channel_failed(
+    async def finalize_messages(
         self,
-        message_id: UUID,
-        channel: str,
-        error: str,
+        results: list[tuple[UUID, str, list[ChannelOutcome]]],
     ) -> None:
         """
-        Mark a channel delivery as failed.
+        Record channel outcomes and final statuses for several messages atomically.
 
         Args:
-            message_id: UUID of the message
-            channel: Channel name
-            error: Error message
+            results: (message_id, status, outcomes) per message
         """
         ...
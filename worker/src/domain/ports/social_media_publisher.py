@@ -5,23 +5,33 @@ This is the interface for intelligent multi-channel publishing.
 Can be implemented by direct API calls or AI agents.
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Protocol
 
 from .channel_gateway import ChannelType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PublishRequest:
     """Request to publish content across channels."""
 
     content: str
-    channels: list[ChannelType]
+    channels: tuple[ChannelType, ...]
     media_url: str | None = None
     metadata: dict | None = None  # Additional context (certification_type, member_name, etc.)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class ChannelOutcome:
+    """Outcome of publishing to a single channel."""
+
+    channel: ChannelType
+    success: bool
+    external_id: str | None = None  # Post/message ID on success
+    error: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
 class PublishResult:
     """Result of a multi-channel publish operation."""
 
@@ -30,7 +40,7 @@ class PublishResult:
     metrics: dict | None = None  # Optional metrics
 
 
-class SocialMediaPublisher(ABC):
+class SocialMediaPublisher(Protocol):
     """
     Outbound port for publishing to social media.
 
@@ -39,7 +49,6 @@ class SocialMediaPublisher(ABC):
     - AI Agent publishing (intelligent, adaptive)
     """
 
-    @abstractmethod
     async def publish(self, request: PublishRequest) -> PublishResult:
         """
         Publish content to the requested channels.
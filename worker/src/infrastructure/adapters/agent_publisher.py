@@ -8,16 +8,23 @@ Security: Includes content filtering guardrails to prevent
 prompt injection and policy violations.
 """
 
+import asyncio
+from functools import lru_cache
+from typing import Any
+
+import orjson
 import structlog
 from strands import Agent, tool
 from strands.models import BedrockModel
 
 from ...domain.ports import (
-    SocialMediaPublisher,
+    ChannelOutcome,
     PublishRequest,
     PublishResult,
     ChannelType,
     ContentRisk,
+    Direction,
+    FilterResult,
 )
 from .channel_gateway_factory import ChannelGatewayFactory
 from .content_filter_impl import ContentFilterImpl
@@ -32,8 +39,8 @@ Your job is to post certification announcements across multiple social media pla
 
 For each platform, you should:
 1. Adapt the content to fit the platform's style and character limits
-2. Use the appropriate tool to post
-3. Report the results
+2. Submit all adapted posts in a single plan_posts call
+3. Report the plan
 
 Platform guidelines:
 - Facebook: Longer posts OK (up to 500 chars), use emojis, hashtags at end, include call to action
@@ -45,121 +52,138 @@ Always include relevant hashtags like #AWSCertified #CloudCommunity #AWSCommunit
 
 When posting to multiple platforms:
 1. First adapt the content for each platform's style
-2. Post to each requested channel
-3. Summarize the results at the end
+2. Call plan_posts exactly once with a mapping of channel name to post text
+   (e.g. {"facebook": "...", "linkedin": "..."})
+3. Summarize the plan at the end
 """
 
+# User prompt; optional lines carry their own trailing newline
+USER_PROMPT_TEMPLATE = (
+    "Please post the following announcement to these channels: {channels}\n"
+    "\nContent: {content}\n"
+    "{media_line}\n"
+    "{certification_line}"
+    "{member_line}"
+    "\nAdapt the content for each requested channel and submit them all with plan_posts."
+)
 
-def _create_tools():
-    """
-    Create tool functions that use the channel gateways.
 
-    Tools are created as closures to maintain clean separation
-    while still accessing the gateway factory.
+@tool
+def plan_posts(plan: dict) -> dict:
     """
+    Submit the adapted post for every requested channel.
 
-    @tool
-    async def post_to_facebook(content: str, media_url: str | None = None) -> dict:
-        """
-        Post content to the Facebook Page.
-
-        Best for longer announcements with images. Supports hashtags and emojis.
-
-        Args:
-            content: The post content/caption to publish
-            media_url: Optional URL to an image to include in the post
-
-        Returns:
-            Dictionary with success status and post_id or error message
-        """
-        logger.info("Agent posting to Facebook", content_length=len(content))
-        gateway = ChannelGatewayFactory.get_gateway(ChannelType.FACEBOOK)
-        result = await gateway.send(recipient_id="", content=content, media_url=media_url)
-        return {
-            "success": result.success,
-            "post_id": result.external_id,
-            "error": result.error,
-            "platform": "facebook",
-        }
-
-    @tool
-    async def post_to_instagram(content: str, media_url: str) -> dict:
-        """
-        Post content to Instagram.
+    Call this once with all channels; the posts are published in
+    parallel after the plan is returned.
 
-        Requires an image. Good for visual announcements with emojis and hashtags.
+    Args:
+        plan: Mapping of channel name (facebook, instagram, linkedin,
+            whatsapp) to the adapted post content for that channel
 
-        Args:
-            content: The caption for the Instagram post
-            media_url: URL to the image (required for Instagram)
-
-        Returns:
-            Dictionary with success status and post_id or error message
-        """
-        logger.info("Agent posting to Instagram", content_length=len(content))
-        gateway = ChannelGatewayFactory.get_gateway(ChannelType.INSTAGRAM)
-        result = await gateway.send(recipient_id="", content=content, media_url=media_url)
-        return {
-            "success": result.success,
-            "post_id": result.external_id,
-            "error": result.error,
-            "platform": "instagram",
-        }
-
-    @tool
-    async def post_to_linkedin(content: str, media_url: str | None = None) -> dict:
-        """
-        Post content to LinkedIn Company Page.
-
-        Best for professional announcements. Use formal tone and relevant hashtags.
+    Returns:
+        The submitted plan
+    """
+    # Pre-encoded ToolResult: Strands would otherwise stringify the dict itself
+    return {"status": "success", "content": [{"text": orjson.dumps(plan).decode()}]}
 
-        Args:
-            content: The post content for LinkedIn
-            media_url: Optional URL to an image to include
 
-        Returns:
-            Dictionary with success status and post_id or error message
-        """
-        logger.info("Agent posting to LinkedIn", content_length=len(content))
-        gateway = ChannelGatewayFactory.get_gateway(ChannelType.LINKEDIN)
-        result = await gateway.send(recipient_id="", content=content, media_url=media_url)
-        return {
-            "success": result.success,
-            "post_id": result.external_id,
-            "error": result.error,
-            "platform": "linkedin",
-        }
+# Static tool manifest, registered once per agent
+TOOLS = (plan_posts,)
 
-    @tool
-    async def send_whatsapp(content: str) -> dict:
-        """
-        Send a message to the WhatsApp community group.
 
-        Best for quick, celebratory notifications. Keep messages short and personal.
+# Channels the agent posts to. Email and SMS need a per-message recipient,
+# which this path doesn't carry, so they are never planned.
+_AGENT_CHANNELS = frozenset(
+    {ChannelType.FACEBOOK, ChannelType.INSTAGRAM, ChannelType.LINKEDIN, ChannelType.WHATSAPP}
+)
 
-        Args:
-            content: The message content to send
+# Plan key -> channel. Accepts channel names and the legacy per-channel
+# tool names, so no string munging is needed per key.
+_PLAN_KEY_TO_CHANNEL: dict[str, ChannelType] = {
+    **{c.value: c for c in _AGENT_CHANNELS},
+    "post_to_facebook": ChannelType.FACEBOOK,
+    "post_to_instagram": ChannelType.INSTAGRAM,
+    "post_to_linkedin": ChannelType.LINKEDIN,
+    "send_whatsapp": ChannelType.WHATSAPP,
+}
+
+
+def _extract_plan(messages: list[dict]) -> dict[ChannelType, str]:
+    """Return the most recent plan_posts input, keyed by channel."""
+    for message in reversed(messages):
+        for content_block in message.get("content", []):
+            tool_use = content_block.get("toolUse")
+            if tool_use and tool_use.get("name") == "plan_posts":
+                plan = tool_use.get("input", {}).get("plan") or {}
+                return {
+                    _PLAN_KEY_TO_CHANNEL[key]: post
+                    for key, post in plan.items()
+                    if key in _PLAN_KEY_TO_CHANNEL
+                }
+    return {}
+
+
+def _build_user_prompt(
+    content: str,
+    channels: tuple[ChannelType, ...],
+    media_url: str | None,
+    certification_type: str | None,
+    member_name: str | None,
+) -> str:
+    """Render the user prompt for one announcement."""
+    return USER_PROMPT_TEMPLATE.format(
+        channels=", ".join(channels),
+        content=content,
+        media_line=(
+            f"Media URL: {media_url}"
+            if media_url
+            else "No image provided (skip Instagram if no image)"
+        ),
+        certification_line=(
+            f"Certification: {certification_type}\n" if certification_type is not None else ""
+        ),
+        member_line=f"Member: {member_name}\n" if member_name is not None else "",
+    )
+
+
+@lru_cache(maxsize=4)
+def _build_model(model_id: str, region: str, latency_optimized: bool = False) -> BedrockModel:
+    """
+    Build the Bedrock model once per model and region.
 
-        Returns:
-            Dictionary with success status and message_id or error message
-        """
-        logger.info("Agent sending WhatsApp", content_length=len(content))
-        gateway = ChannelGatewayFactory.get_gateway(ChannelType.WHATSAPP)
-        result = await gateway.send(
-            recipient_id=settings.whatsapp_community_id,
-            content=content,
-        )
-        return {
-            "success": result.success,
-            "message_id": result.external_id,
-            "error": result.error,
-            "platform": "whatsapp",
-        }
+    Constructing BedrockModel resolves the boto3 credential chain, so
+    publishers share one instance. The tool manifest and system prompt
+    never change, so Bedrock caches them as a prompt prefix.
+    """
+    model_kwargs: dict[str, Any] = {}
+    if latency_optimized:
+        # Top-level Converse field, not a model request field
+        model_kwargs["additional_args"] = {"performanceConfig": {"latency": "optimized"}}
+    return BedrockModel(
+        model_id=model_id,
+        region_name=region,
+        cache_tools="default",
+        cache_prompt="default",
+        **model_kwargs,
+    )
+
+
+def _build_agent(model: BedrockModel) -> Agent:
+    """
+    Build an agent for one planning turn around the shared model.
 
-    return [post_to_facebook, post_to_instagram, post_to_linkedin, send_whatsapp]
+    An Agent is only the conversation state and tool registry over the
+    model, so a fresh one per turn is cheap. Turns then run concurrently,
+    and no announcement's history or plan can reach another's.
+    """
+    return Agent(
+        model=model,
+        system_prompt=SYSTEM_PROMPT,
+        tools=list(TOOLS),
+    )
 
 
-class AgentPublisher(SocialMediaPublisher):
+class AgentPublisher:
     """
     AI Agent implementation of SocialMediaPublisher using Strands SDK.
 
@@ -173,20 +197,15 @@ class AgentPublisher(SocialMediaPublisher):
 
     def __init__(self, strict_mode: bool = True) -> None:
         """
-        Initialize the Strands agent with Bedrock model and tools.
+        Initialize the publisher with the shared Bedrock model.
 
         Args:
             strict_mode: If True, block on medium risk content.
         """
-        self._model = BedrockModel(
-            model_id=settings.bedrock_model_id,
-            region_name=settings.aws_region,
-        )
-        self._tools = _create_tools()
-        self._agent = Agent(
-            model=self._model,
-            system_prompt=SYSTEM_PROMPT,
-            tools=self._tools,
+        self._model = _build_model(
+            settings.bedrock_model_id,
+            settings.aws_region,
+            settings.bedrock_latency_optimized,
         )
         # Security: Initialize content filter
         self._content_filter = ContentFilterImpl(strict_mode=strict_mode)
@@ -200,9 +219,9 @@ class AgentPublisher(SocialMediaPublisher):
         The agent will:
         1. Filter input for prompt injection
         2. Analyze the content and target channels
-        3. Optimize content for each platform
+        3. Plan optimized content for every platform in one call
         4. Filter output for policy violations
-        5. Post to each channel using tools
+        5. Post to all channels concurrently
         6. Return results with summary
 
         Args:
@@ -211,66 +230,49 @@ class AgentPublisher(SocialMediaPublisher):
         Returns:
             PublishResult with per-channel results and agent summary
         """
-        # Security: Filter input before sending to AI
-        input_filter_result = self._content_filter.filter_input(request.content)
+        # Nothing to publish: skip filtering and the Bedrock call entirely
+        if not request.channels:
+            return PublishResult(
+                channel_results={},
+                summary="No channels requested",
+                metrics={"skipped": True},
+            )
 
+        input_filter_result = self._filter_input(request)
         if not input_filter_result.is_safe:
-            logger.error(
-                "Content blocked by input filter",
-                risk_level=input_filter_result.risk_level.value,
-                violations=[v.value for v in input_filter_result.violations],
-                reason=input_filter_result.reason,
-            )
             return PublishResult(
                 channel_results={},
                 summary=f"Content blocked: {input_filter_result.reason}",
-                metrics={"blocked": True, "risk_level": input_filter_result.risk_level.value},
+                metrics={"blocked": True, "risk_level": input_filter_result.risk_level},
             )
 
-        # Use sanitized content
-        safe_content = input_filter_result.sanitized_content or request.content
-
-        # Build the user prompt
-        channel_names = [c.value for c in request.channels]
-        prompt_parts = [
-            f"Please post the following announcement to these channels: {', '.join(channel_names)}",
-            f"\nContent: {safe_content}",
-        ]
-
-        if request.media_url:
-            prompt_parts.append(f"Media URL: {request.media_url}")
-        else:
-            prompt_parts.append("No image provided (skip Instagram if no image)")
-
-        if request.metadata:
-            if "certification_type" in request.metadata:
-                prompt_parts.append(f"Certification: {request.metadata['certification_type']}")
-            if "member_name" in request.metadata:
-                prompt_parts.append(f"Member: {request.metadata['member_name']}")
-
-        prompt_parts.append("\nPost to each requested channel, adapting the content appropriately.")
-        user_prompt = "\n".join(prompt_parts)
+        result, planned_posts = await self._plan(request, input_filter_result)
 
-        logger.info(
-            "Starting agent publisher",
-            channels=channel_names,
-            has_media=bool(request.media_url),
-            input_risk=input_filter_result.risk_level.value,
+        # Fan out all channel sends concurrently
+        outcomes = await asyncio.gather(
+            *(
+                self._publish_to_channel(channel_type, planned_post, request.media_url)
+                for channel_type, planned_post in zip(request.channels, planned_posts)
+            )
         )
-
-        # Run the agent
-        result = self._agent(user_prompt)
-
-        # Extract results
-        channel_results: dict[ChannelType, dict] = {}
-        summary = ""
+        channel_results: dict[ChannelType, dict] = {
+            outcome.channel: {
+                "success": outcome.success,
+                "external_id": outcome.external_id,
+                "error": outcome.error,
+            }
+            for outcome in outcomes
+        }
 
         # Get the final text response
-        if result.message and "content" in result.message:
-            for content_block in result.message["content"]:
-                if "text" in content_block:
-                    summary = content_block["text"]
-                    break
+        summary = next(
+            (
+                content_block["text"]
+                for content_block in (result.message or {}).get("content", ())
+                if "text" in content_block
+            ),
+            "",
+        )
 
         # Security: Filter AI output before returning
         if summary:
@@ -279,8 +281,8 @@ class AgentPublisher(SocialMediaPublisher):
             if not output_filter_result.is_safe:
                 logger.error(
                     "AI output blocked by filter",
-                    risk_level=output_filter_result.risk_level.value,
-                    violations=[v.value for v in output_filter_result.violations],
+                    risk_level=output_filter_result.risk_level,
+                    violations=output_filter_result.violations,
                 )
                 # Don't expose potentially compromised output
                 summary = "Content generation completed but output was filtered for safety."
@@ -288,32 +290,18 @@ class AgentPublisher(SocialMediaPublisher):
             elif output_filter_result.risk_level != ContentRisk.SAFE:
                 logger.warning(
                     "AI output has elevated risk",
-                    risk_level=output_filter_result.risk_level.value,
+                    risk_level=output_filter_result.risk_level,
                 )
                 # Use sanitized version
                 summary = output_filter_result.sanitized_content or summary
 
-        # Extract metrics and tool results
+        # Extract metrics
         metrics = {"input_filtered": True, "output_filtered": True}
-        if hasattr(result, "metrics"):
-            agent_metrics = (
-                result.metrics.get_summary() if hasattr(result.metrics, "get_summary") else {}
-            )
-            metrics.update(agent_metrics)
-
-            # Parse tool usage to get channel results
-            if hasattr(result.metrics, "tool_usage"):
-                for tool_name, tool_data in result.metrics.tool_usage.items():
-                    platform = tool_name.replace("post_to_", "").replace("send_", "")
-                    try:
-                        channel_type = ChannelType(platform)
-                        channel_results[channel_type] = {
-                            "success": tool_data.get("execution_stats", {}).get("success_rate", 0)
-                            == 1.0,
-                            "call_count": tool_data.get("execution_stats", {}).get("call_count", 0),
-                        }
-                    except ValueError:
-                        pass  # Not a channel tool
+        agent_metrics = getattr(result, "metrics", None)
+        if agent_metrics is not None:
+            get_summary = getattr(agent_metrics, "get_summary", None)
+            if get_summary is not None:
+                metrics.update(get_summary())
 
         logger.info(
             "Agent publisher completed",
@@ -325,3 +313,132 @@ class AgentPublisher(SocialMediaPublisher):
             summary=summary,
             metrics=metrics,
         )
+
+    def _filter_input(self, request: PublishRequest) -> FilterResult:
+        """Security: Filter input before sending to AI."""
+        input_filter_result = self._content_filter.filter_input(request.content)
+
+        if not input_filter_result.is_safe:
+            logger.error(
+                "Content blocked by input filter",
+                risk_level=input_filter_result.risk_level,
+                violations=input_filter_result.violations,
+                reason=input_filter_result.reason,
+            )
+        return input_filter_result
+
+    async def _plan(
+        self,
+        request: PublishRequest,
+        input_filter_result: FilterResult,
+    ) -> tuple[Any, list[tuple[str, FilterResult] | None]]:
+        """
+        Run the agent planning turn and filter every planned post.
+
+        Returns:
+            The agent result and (post content, output filter result) per
+            requested channel, or None where the plan has no post for it
+        """
+        # Use sanitized content
+        safe_content = input_filter_result.sanitized_content or request.content
+
+        # Build the user prompt
+        metadata = request.metadata or {}
+        user_prompt = _build_user_prompt(
+            safe_content,
+            # Sorted, so the same channel set always renders the same prompt
+            tuple(sorted(request.channels)),
+            request.media_url,
+            str(metadata["certification_type"]) if "certification_type" in metadata else None,
+            str(metadata["member_name"]) if "member_name" in metadata else None,
+        )
+
+        logger.info(
+            "Starting agent publisher",
+            channels=request.channels,
+            has_media=bool(request.media_url),
+            input_risk=input_filter_result.risk_level,
+        )
+
+        # Run the agent (one planning turn, no per-channel tool calls) without
+        # blocking the event loop for the Bedrock round-trip
+        agent = _build_agent(self._model)
+        result = await agent.invoke_async(user_prompt)
+        plan = _extract_plan(agent.messages)
+
+        # Security: Filter every planned post in one batch before publishing
+        posts = [plan.get(channel_type) for channel_type in request.channels]
+        output_filter_results = iter(
+            self._content_filter.filter_batch([(post, Direction.OUTPUT) for post in posts if post])
+        )
+        return result, [(post, next(output_filter_results)) if post else None for post in posts]
+
+    async def _publish_to_channel(
+        self,
+        channel_type: ChannelType,
+        planned_post: tuple[str, FilterResult] | None,
+        media_url: str | None,
+    ) -> ChannelOutcome:
+        """Send filtered planned content to a single channel."""
+        if channel_type not in _AGENT_CHANNELS:
+            return ChannelOutcome(
+                channel=channel_type,
+                success=False,
+                error="Channel needs a recipient; not supported by the agent publisher",
+            )
+
+        # Instagram requires media
+        if channel_type == ChannelType.INSTAGRAM and not media_url:
+            return ChannelOutcome(
+                channel=channel_type,
+                success=False,
+                error="Instagram requires a media URL",
+            )
+
+        if planned_post is None:
+            logger.error("Agent plan has no post for channel", channel=channel_type)
+            return ChannelOutcome(
+                channel=channel_type,
+                success=False,
+                error="No post planned for channel",
+            )
+
+        content, output_filter_result = planned_post
+        if not output_filter_result.is_safe:
+            logger.error(
+                "AI output blocked by filter",
+                channel=channel_type,
+                risk_level=output_filter_result.risk_level,
+                violations=output_filter_result.violations,
+            )
+            return ChannelOutcome(
+                channel=channel_type,
+                success=False,
+                error="Content blocked by output filter",
+            )
+        content = output_filter_result.sanitized_content or content
+
+        logger.info(
+            "Agent posting to channel",
+            channel=channel_type,
+            content_length=len(content),
+        )
+        gateway = ChannelGatewayFactory.get_gateway(channel_type)
+        recipient_id = (
+            settings.whatsapp_community_id if channel_type == ChannelType.WHATSAPP else ""
+        )
+        try:
+            async with ChannelGatewayFactory.get_semaphore(channel_type):
+                result = await gateway.send(
+                    recipient_id=recipient_id, content=content, media_url=media_url
+                )
+        except Exception as e:  # noqa: BLE001 - a failing gateway fails only its own channel
+            logger.error("Channel publish failed", channel=channel_type, error=str(e))
+            return ChannelOutcome(channel=channel_type, success=False, error=str(e))
+
+        return ChannelOutcome(
+            channel=channel_type,
+            success=result.success,
+            external_id=result.external_id,
+            error=result.error,
+        )
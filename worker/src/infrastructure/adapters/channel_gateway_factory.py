@@ -5,6 +5,12 @@ This factory creates the appropriate gateway implementation based on channel typ
 It encapsulates the creation logic and configuration.
 """
 
+import asyncio
+from collections.abc import Callable
+from typing import ClassVar
+
+import structlog
+
 from ...domain.ports import ChannelGateway, ChannelType
 from ...channels import (
     FacebookGateway,
@@ -15,6 +21,47 @@ from ...channels import (
     SmsGateway,
 )
 from ...config import settings
+from ..http import get_aws_session, get_http_client
+
+logger = structlog.get_logger()
+
+# Channel type -> gateway constructor, reading settings at build time
+_BUILDERS: dict[ChannelType, Callable[[], ChannelGateway]] = {
+    ChannelType.FACEBOOK: lambda: FacebookGateway(
+        access_token=settings.meta_access_token,
+        page_id=settings.meta_page_id,
+        client=get_http_client(),
+        rate_limit=settings.channel_rate_limit,
+    ),
+    ChannelType.INSTAGRAM: lambda: InstagramGateway(
+        access_token=settings.meta_access_token,
+        instagram_account_id=settings.meta_instagram_account_id,
+        client=get_http_client(),
+        rate_limit=settings.channel_rate_limit,
+    ),
+    ChannelType.LINKEDIN: lambda: LinkedInGateway(
+        access_token=settings.linkedin_access_token,
+        organization_id=settings.linkedin_organization_id,
+        client=get_http_client(),
+        rate_limit=settings.channel_rate_limit,
+    ),
+    ChannelType.WHATSAPP: lambda: WhatsAppGateway(
+        access_token=settings.meta_access_token,
+        phone_number_id=settings.meta_phone_number_id,
+        client=get_http_client(),
+        rate_limit=settings.channel_rate_limit,
+    ),
+    ChannelType.EMAIL: lambda: EmailGateway(
+        sender_email=settings.ses_sender_email,
+        region=settings.aws_region,
+        session=get_aws_session(),
+    ),
+    ChannelType.SMS: lambda: SmsGateway(
+        sender_id=settings.sns_sender_id,
+        region=settings.aws_region,
+        session=get_aws_session(),
+    ),
+}
 
 
 class ChannelGatewayFactory:
@@ -25,7 +72,10 @@ class ChannelGatewayFactory:
     Uses lazy initialization to avoid creating unused gateways.
     """
 
-    _instances: dict[ChannelType, ChannelGateway] = {}
+    _instances: ClassVar[dict[ChannelType, ChannelGateway]] = {}
+    # Semaphores bind to the event loop they are first used on
+    _semaphores: ClassVar[dict[ChannelType, asyncio.Semaphore]] = {}
+    _semaphore_loop: ClassVar[asyncio.AbstractEventLoop | None] = None
 
     @classmethod
     def get_gateway(cls, channel_type: ChannelType) -> ChannelGateway:
@@ -45,42 +95,31 @@ class ChannelGatewayFactory:
             cls._instances[channel_type] = cls._create_gateway(channel_type)
         return cls._instances[channel_type]
 
+    @classmethod
+    def get_semaphore(cls, channel_type: ChannelType) -> asyncio.Semaphore:
+        """
+        Get the semaphore limiting concurrent sends to a channel.
+
+        Shared by every publisher, so bursts of jobs for one channel queue
+        instead of tripping the platform's rate limits. Must be called
+        from a running event loop; a new loop gets fresh semaphores.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._semaphore_loop is not loop:
+            cls._semaphores.clear()
+            cls._semaphore_loop = loop
+        if channel_type not in cls._semaphores:
+            cls._semaphores[channel_type] = asyncio.Semaphore(settings.channel_max_concurrency)
+        return cls._semaphores[channel_type]
+
     @classmethod
     def _create_gateway(cls, channel_type: ChannelType) -> ChannelGateway:
         """Create a new gateway instance for the channel type."""
-        match channel_type:
-            case ChannelType.FACEBOOK:
-                return FacebookGateway(
-                    access_token=settings.meta_access_token,
-                    page_id=settings.meta_page_id,
-                )
-            case ChannelType.INSTAGRAM:
-                return InstagramGateway(
-                    access_token=settings.meta_access_token,
-                    instagram_account_id=settings.meta_instagram_account_id,
-                )
-            case ChannelType.LINKEDIN:
-                return LinkedInGateway(
-                    access_token=settings.linkedin_access_token,
-                    organization_id=settings.linkedin_organization_id,
-                )
-            case ChannelType.WHATSAPP:
-                return WhatsAppGateway(
-                    access_token=settings.meta_access_token,
-                    phone_number_id=settings.meta_phone_number_id,
-                )
-            case ChannelType.EMAIL:
-                return EmailGateway(
-                    sender_email=settings.ses_sender_email,
-                    region=settings.aws_region,
-                )
-            case ChannelType.SMS:
-                return SmsGateway(
-                    sender_id=settings.sns_sender_id,
-                    region=settings.aws_region,
-                )
-            case _:
-                raise ValueError(f"Unsupported channel type: {channel_type}")
+        try:
+            builder = _BUILDERS[channel_type]
+        except KeyError:
+            raise ValueError(f"Unsupported channel type: {channel_type}") from None
+        return builder()
 
     @classmethod
     def get_all_gateways(cls) -> dict[ChannelType, ChannelGateway]:
@@ -92,7 +131,24 @@ class ChannelGatewayFactory:
                 pass  # Skip unsupported channels
         return cls._instances.copy()
 
+    @classmethod
+    def warmup(cls) -> None:
+        """
+        Create every gateway up front, at worker startup.
+
+        Moves client construction and credential resolution off the first
+        publish for each channel. A gateway that fails to build is retried
+        lazily on first use.
+        """
+        for channel_type in ChannelType:
+            try:
+                cls.get_gateway(channel_type)
+            except Exception as e:  # noqa: BLE001 - best effort; retried on first use
+                logger.warning("Gateway warmup failed", channel=channel_type, error=str(e))
+
     @classmethod
     def reset(cls) -> None:
         """Reset all cached gateway instances (useful for testing)."""
         cls._instances.clear()
+        cls._semaphores.clear()
+        cls._semaphore_loop = None
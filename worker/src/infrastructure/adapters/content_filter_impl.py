@@ -8,15 +8,27 @@ Security: Implements input/output filtering to prevent:
 - Policy violations
 """
 
+import hashlib
 import html
 import re
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
 from urllib.parse import urlparse
 
 import structlog
 
+try:
+    # Linear-time DFA matching for the scan patterns (optional)
+    import re2
+except ImportError:
+    re2 = None
+
 from ...domain.ports.content_filter import (
-    ContentFilter,
+    SAFE_RESULT,
     ContentRisk,
+    Direction,
     FilterResult,
     ViolationType,
 )
@@ -33,13 +45,56 @@ RISK_ORDER = {
 }
 
 
+# Recently vetted inputs / AI outputs kept for reuse
+INPUT_CACHE_SIZE = 1024
+OUTPUT_CACHE_SIZE = 1024
+
+
+def _content_key(content: str) -> bytes:
+    """128-bit digest used to key cached filter results."""
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+def _cached(
+    cache: OrderedDict[bytes, FilterResult],
+    max_size: int,
+    content: str,
+    run: Callable[[str], FilterResult],
+) -> FilterResult:
+    """Return the cached result for content, or run the filter and cache it."""
+    key = _content_key(content)
+    cached = cache.get(key)
+    if cached is not None:
+        cache.move_to_end(key)
+        return cached
+
+    result = run(content)
+    cache[key] = result
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+    return result
+
+
+def _screen(content: str, *families: tuple[str, ...]) -> list[bool]:
+    """
+    Cheap substring screen run before the regexes, per pattern family.
+
+    Returns whether each family's triggers occur; a family with no hit
+    cannot match, so its regexes are skipped.
+    """
+    if not content.isascii():
+        return [True] * len(families)
+    lowered = content.lower()
+    return [any(t in lowered for t in triggers) for triggers in families]
+
+
 def _max_risk(a: ContentRisk, b: ContentRisk) -> ContentRisk:
     """Return the higher risk level."""
     return a if RISK_ORDER[a] >= RISK_ORDER[b] else b
 
 
 # Prompt injection patterns (case-insensitive)
-PROMPT_INJECTION_PATTERNS = [
+PROMPT_INJECTION_PATTERNS = (
     r"ignore\s+(previous|all|above)\s+(instructions?|prompts?)",
     r"disregard\s+(previous|all|above)",
     r"forget\s+(everything|all|previous)",
@@ -58,10 +113,10 @@ PROMPT_INJECTION_PATTERNS = [
     r"run\s+(command|code|script)",
     r"eval\s*\(",
     r"exec\s*\(",
-]
+)
 
 # Malicious URL patterns
-MALICIOUS_URL_PATTERNS = [
+MALICIOUS_URL_PATTERNS = (
     r"bit\.ly",
     r"tinyurl\.com",
     r"t\.co",  # Allow Twitter but flag for review
@@ -72,10 +127,10 @@ MALICIOUS_URL_PATTERNS = [
     r"adf\.ly",
     r"j\.mp",
     r"dlvr\.it",
-]
+)
 
 # Allowed domains for URLs
-ALLOWED_URL_DOMAINS = [
+ALLOWED_URL_DOMAINS = (
     "aws.amazon.com",
     "amazon.com",
     "linkedin.com",
@@ -87,32 +142,124 @@ ALLOWED_URL_DOMAINS = [
     "youtube.com",
     "credly.com",
     "certmetrics.com",
-]
+)
+_ALLOWED_EXACT = frozenset(ALLOWED_URL_DOMAINS)
+_ALLOWED_SUFFIXES = tuple(f".{d}" for d in ALLOWED_URL_DOMAINS)
 
 # PII patterns
-PII_PATTERNS = [
+PII_PATTERNS = (
     r"\b\d{3}[-.]?\d{2}[-.]?\d{4}\b",  # SSN
     r"\b\d{16}\b",  # Credit card (basic)
     r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",  # Email (flag, don't block)
     r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b",  # Phone number
-]
+)
 
 # Profanity list (basic - extend as needed)
-PROFANITY_PATTERNS = [
+PROFANITY_PATTERNS = (
     # Add patterns as needed - keeping minimal for example
-]
+)
 
 # Off-topic patterns (not related to AWS certifications)
-OFF_TOPIC_PATTERNS = [
+OFF_TOPIC_PATTERNS = (
     r"(buy|sell|purchase)\s+(now|today|cheap)",
     r"(click|visit)\s+(here|now|link)",
     r"(free|discount|offer)\s+(money|gift|prize)",
     r"(casino|gambling|lottery)",
     r"(crypto|bitcoin|nft)\s+(invest|buy|sell)",
-]
+)
 
 
-class ContentFilterImpl(ContentFilter):
+# google-re2 when installed, stdlib re otherwise. Flags are written inline
+# because the two compile() signatures differ. Either engine's patterns and
+# matches are returned, hence Any rather than re.Pattern / re.Match.
+_compile: Callable[[str], Any] = re2.compile if re2 is not None else re.compile
+
+
+def _fuse(patterns: tuple[str, ...], ignore_case: bool = False) -> Any:
+    """Fuse patterns into one alternation; group ``p<i>`` marks pattern i."""
+    fused = "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(patterns))
+    return _compile(f"(?i){fused}" if ignore_case else fused)
+
+
+def _matched_pattern(match: Any, patterns: tuple[str, ...]) -> str:
+    """Return the source pattern that produced a fused-regex match."""
+    return patterns[int(match.lastgroup[1:])]
+
+
+# Compiled once at import; instances share them. One pass per category.
+_INJECTION_RE = _fuse(PROMPT_INJECTION_PATTERNS, ignore_case=True)
+_MALICIOUS_URL_RE = _fuse(MALICIOUS_URL_PATTERNS, ignore_case=True)
+_PII_RE = _fuse(PII_PATTERNS)
+_OFF_TOPIC_RE = _fuse(OFF_TOPIC_PATTERNS, ignore_case=True)
+# Literals every pattern of a direction contains, matched case-insensitively
+# on ASCII content. Content containing none of them cannot match, so the
+# regex scans are skipped. Non-ASCII content always goes to the regexes:
+# their Unicode case folding (e.g. "ſ" for "s") differs from str.lower().
+_INJECTION_TRIGGERS = (
+    "ignore",
+    "disregard",
+    "forget",
+    "instruction",
+    "system",
+    "you",
+    "act",
+    "pretend",
+    "roleplay",
+    "jailbreak",
+    "bypass",
+    "override",
+    "exec",
+    "run",
+    "eval",
+)
+_OFF_TOPIC_TRIGGERS = (
+    "buy",
+    "sell",
+    "purchase",
+    "click",
+    "visit",
+    "free",
+    "discount",
+    "offer",
+    "casino",
+    "gambling",
+    "lottery",
+    "crypto",
+    "bitcoin",
+    "nft",
+)
+_PII_TRIGGERS = ("@",) + tuple("0123456789")
+_URL_RE = _compile(r"https?://[^\s]+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@lru_cache(maxsize=4096)
+def _is_malicious_url(url: str) -> bool:
+    """Check if URL is potentially malicious. Memoized, URLs recur across posts."""
+    # Check against known shorteners/suspicious domains
+    if _MALICIOUS_URL_RE.search(url):
+        return True
+
+    # Check if domain is in allowed list
+    try:
+        domain = urlparse(url).netloc.lower()
+        # Remove www. prefix
+        if domain.startswith("www."):
+            domain = domain[4:]
+
+        # Exact match or subdomain of an allowed domain
+        if domain in _ALLOWED_EXACT or domain.endswith(_ALLOWED_SUFFIXES):
+            return False
+
+        # Unknown domain - flag as suspicious but don't block
+        logger.info("Unknown URL domain", domain=domain, url=url)
+        return False  # Don't block, just log
+
+    except Exception:
+        return True  # Can't parse = suspicious
+
+
+class ContentFilterImpl:
     """
     Implementation of content filtering with security guardrails.
 
@@ -132,53 +279,75 @@ class ContentFilterImpl(ContentFilter):
             strict_mode: If True, block on medium risk. If False, only block high risk.
         """
         self._strict_mode = strict_mode
-        self._injection_patterns = [re.compile(p, re.IGNORECASE) for p in PROMPT_INJECTION_PATTERNS]
-        self._malicious_url_patterns = [
-            re.compile(p, re.IGNORECASE) for p in MALICIOUS_URL_PATTERNS
-        ]
-        self._pii_patterns = [re.compile(p) for p in PII_PATTERNS]
-        self._off_topic_patterns = [re.compile(p, re.IGNORECASE) for p in OFF_TOPIC_PATTERNS]
+        self._recent_inputs: OrderedDict[bytes, FilterResult] = OrderedDict()
+        self._recent_outputs: OrderedDict[bytes, FilterResult] = OrderedDict()
+
+    def filter_batch(self, items: list[tuple[str, Direction]]) -> list[FilterResult]:
+        """
+        Filter several pieces of content in one call.
+
+        Identical (content, direction) pairs are only scanned once.
+        """
+        results: dict[tuple[str, Direction], FilterResult] = {}
+        for item in items:
+            if item not in results:
+                content, direction = item
+                if direction == Direction.INPUT:
+                    results[item] = self.filter_input(content)
+                else:
+                    results[item] = self.filter_output(content)
+        return [results[item] for item in items]
 
     def filter_input(self, content: str) -> FilterResult:
         """
         Filter user input before sending to AI.
 
         Security: Detects prompt injection attempts and malicious content.
+        Results are cached by content hash, so retried or replayed messages
+        are only scanned once.
         """
+        return _cached(self._recent_inputs, INPUT_CACHE_SIZE, content, self._filter_input)
+
+    def _filter_input(self, content: str) -> FilterResult:
+        """Run the input checks without consulting the cache."""
         violations: list[ViolationType] = []
         risk_level = ContentRisk.SAFE
+        injection_hit, off_topic_hit = _screen(content, _INJECTION_TRIGGERS, _OFF_TOPIC_TRIGGERS)
 
         # Check for prompt injection
-        for pattern in self._injection_patterns:
-            if pattern.search(content):
-                violations.append(ViolationType.PROMPT_INJECTION)
-                risk_level = ContentRisk.BLOCKED
-                logger.warning(
-                    "Prompt injection detected",
-                    pattern=pattern.pattern,
-                    content_preview=content[:100],
-                )
-                break
+        match = _INJECTION_RE.search(content) if injection_hit else None
+        if match:
+            violations.append(ViolationType.PROMPT_INJECTION)
+            risk_level = ContentRisk.BLOCKED
+            logger.warning(
+                "Prompt injection detected",
+                pattern=_matched_pattern(match, PROMPT_INJECTION_PATTERNS),
+                content_preview=content[:100],
+            )
 
         # Check for malicious URLs
-        if risk_level != ContentRisk.BLOCKED:
-            urls = re.findall(r"https?://[^\s]+", content)
-            for url in urls:
+        if risk_level != ContentRisk.BLOCKED and "http" in content:
+            for m in _URL_RE.finditer(content):
+                url = m.group(0)
                 if self._is_malicious_url(url):
                     violations.append(ViolationType.MALICIOUS_URL)
                     risk_level = _max_risk(risk_level, ContentRisk.HIGH)
                     logger.warning("Malicious URL detected", url=url)
+                    break  # One hit settles the risk level
 
         # Check for off-topic content
-        if risk_level not in (ContentRisk.BLOCKED, ContentRisk.HIGH):
-            for pattern in self._off_topic_patterns:
-                if pattern.search(content):
-                    violations.append(ViolationType.OFF_TOPIC)
-                    risk_level = _max_risk(risk_level, ContentRisk.MEDIUM)
-                    break
+        if (
+            off_topic_hit
+            and risk_level not in (ContentRisk.BLOCKED, ContentRisk.HIGH)
+            and _OFF_TOPIC_RE.search(content)
+        ):
+            violations.append(ViolationType.OFF_TOPIC)
+            risk_level = _max_risk(risk_level, ContentRisk.MEDIUM)
 
         # Sanitize content
         sanitized = self._sanitize_input(content)
+        if risk_level == ContentRisk.SAFE and sanitized == content:
+            return SAFE_RESULT
 
         is_safe = risk_level in (ContentRisk.SAFE, ContentRisk.LOW)
         if not self._strict_mode:
@@ -187,7 +356,7 @@ class ContentFilterImpl(ContentFilter):
         return FilterResult(
             is_safe=is_safe,
             risk_level=risk_level,
-            violations=violations,
+            violations=tuple(violations),
             sanitized_content=sanitized if is_safe else None,
             reason=f"Violations: {[v.value for v in violations]}" if violations else None,
         )
@@ -197,37 +366,48 @@ class ContentFilterImpl(ContentFilter):
         Filter AI-generated output before publishing.
 
         Security: Ensures AI output doesn't contain malicious content or PII.
+        Results are cached by content hash, so output the agent repeats
+        (e.g. the sanitized input echoed back) is only scanned once.
         """
+        return _cached(self._recent_outputs, OUTPUT_CACHE_SIZE, content, self._filter_output)
+
+    def _filter_output(self, content: str) -> FilterResult:
+        """Run the output checks without consulting the cache."""
         violations: list[ViolationType] = []
         risk_level = ContentRisk.SAFE
+        injection_hit, pii_hit = _screen(content, _INJECTION_TRIGGERS, _PII_TRIGGERS)
 
         # Check for PII in output
-        for pattern in self._pii_patterns:
-            if pattern.search(content):
-                violations.append(ViolationType.PII_EXPOSURE)
-                risk_level = _max_risk(risk_level, ContentRisk.HIGH)
-                logger.warning("PII detected in output", pattern=pattern.pattern)
+        match = _PII_RE.search(content) if pii_hit else None
+        if match:
+            violations.append(ViolationType.PII_EXPOSURE)
+            risk_level = _max_risk(risk_level, ContentRisk.HIGH)
+            logger.warning(
+                "PII detected in output",
+                pattern=_matched_pattern(match, PII_PATTERNS),
+            )
 
         # Check for malicious URLs in output
-        urls = re.findall(r"https?://[^\s]+", content)
-        for url in urls:
-            if self._is_malicious_url(url):
-                violations.append(ViolationType.MALICIOUS_URL)
-                risk_level = _max_risk(risk_level, ContentRisk.HIGH)
+        if "http" in content:
+            for m in _URL_RE.finditer(content):
+                if self._is_malicious_url(m.group(0)):
+                    violations.append(ViolationType.MALICIOUS_URL)
+                    risk_level = _max_risk(risk_level, ContentRisk.HIGH)
+                    break  # One hit settles the risk level
 
         # Check for prompt injection artifacts (AI might have been compromised)
-        for pattern in self._injection_patterns:
-            if pattern.search(content):
-                violations.append(ViolationType.PROMPT_INJECTION)
-                risk_level = ContentRisk.BLOCKED
-                logger.error(
-                    "Prompt injection artifact in AI output - possible compromise",
-                    content_preview=content[:200],
-                )
-                break
+        if injection_hit and _INJECTION_RE.search(content):
+            violations.append(ViolationType.PROMPT_INJECTION)
+            risk_level = ContentRisk.BLOCKED
+            logger.error(
+                "Prompt injection artifact in AI output - possible compromise",
+                content_preview=content[:200],
+            )
 
         # Sanitize output
         sanitized = self._sanitize_output(content)
+        if risk_level == ContentRisk.SAFE and sanitized == content:
+            return SAFE_RESULT
 
         is_safe = risk_level in (ContentRisk.SAFE, ContentRisk.LOW)
         if not self._strict_mode:
@@ -236,37 +416,14 @@ class ContentFilterImpl(ContentFilter):
         return FilterResult(
             is_safe=is_safe,
             risk_level=risk_level,
-            violations=violations,
+            violations=tuple(violations),
             sanitized_content=sanitized if is_safe else None,
             reason=f"Violations: {[v.value for v in violations]}" if violations else None,
         )
 
     def _is_malicious_url(self, url: str) -> bool:
         """Check if URL is potentially malicious."""
-        # Check against known shorteners/suspicious domains
-        for pattern in self._malicious_url_patterns:
-            if pattern.search(url):
-                return True
-
-        # Check if domain is in allowed list
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            # Remove www. prefix
-            if domain.startswith("www."):
-                domain = domain[4:]
-
-            # Check if it's a subdomain of allowed domains
-            for allowed in ALLOWED_URL_DOMAINS:
-                if domain == allowed or domain.endswith(f".{allowed}"):
-                    return False
-
-            # Unknown domain - flag as suspicious but don't block
-            logger.info("Unknown URL domain", domain=domain, url=url)
-            return False  # Don't block, just log
-
-        except Exception:
-            return True  # Can't parse = suspicious
+        return _is_malicious_url(url)
 
     def _sanitize_input(self, content: str) -> str:
         """Sanitize user input."""
@@ -280,8 +437,8 @@ class ContentFilterImpl(ContentFilter):
 
     def _sanitize_output(self, content: str) -> str:
         """Sanitize AI output."""
-        # Remove any HTML tags that might have been generated
-        sanitized = re.sub(r"<[^>]+>", "", content)
+        # Remove any HTML tags that might have been generated (most output has none)
+        sanitized = _HTML_TAG_RE.sub("", content) if "<" in content else content
         # Remove null bytes
         sanitized = sanitized.replace("\x00", "")
         # Normalize excessive whitespace but preserve line breaks
@@ -5,20 +5,23 @@ This adapter implements SocialMediaPublisher by directly calling channel gateway
 Simple, fast, but no content optimization.
 """
 
+import asyncio
+
 import structlog
 
 from ...domain.ports import (
-    SocialMediaPublisher,
     PublishRequest,
     PublishResult,
     ChannelType,
+    DeliveryResult,
 )
 from .channel_gateway_factory import ChannelGatewayFactory
+from ...config import settings
 
 logger = structlog.get_logger()
 
 
-class DirectPublisher(SocialMediaPublisher):
+class DirectPublisher:
     """
     Direct implementation of SocialMediaPublisher.
 
@@ -26,6 +29,16 @@ class DirectPublisher(SocialMediaPublisher):
     Fast and simple, but doesn't adapt content per platform.
     """
 
+    def __init__(self, max_concurrency: int | None = None) -> None:
+        """
+        Initialize direct publisher.
+
+        Args:
+            max_concurrency: Cap on outstanding channel sends across all
+                publishes (defaults to settings.publisher_max_concurrency)
+        """
+        self._sem = asyncio.Semaphore(max_concurrency or settings.publisher_max_concurrency)
+
     async def publish(self, request: PublishRequest) -> PublishResult:
         """
         Publish content directly to all requested channels.
@@ -36,36 +49,37 @@ class DirectPublisher(SocialMediaPublisher):
         Returns:
             PublishResult with per-channel results
         """
-        channel_results: dict[ChannelType, dict] = {}
-
-        # Create tasks for parallel execution
-        tasks = []
-        for channel_type in request.channels:
-            task = self._publish_to_channel(
-                channel_type=channel_type,
-                content=request.content,
-                media_url=request.media_url,
-            )
-            tasks.append((channel_type, task))
+        # Execute all channel sends concurrently
+        results = await asyncio.gather(
+            *(
+                self._publish_to_channel(
+                    channel_type=channel_type,
+                    content=request.content,
+                    media_url=request.media_url,
+                )
+                for channel_type in request.channels
+            ),
+            return_exceptions=True,
+        )
 
-        # Execute all tasks concurrently
-        for channel_type, task in tasks:
-            try:
-                result = await task
-                channel_results[channel_type] = {
-                    "success": result.success,
-                    "external_id": result.external_id,
-                    "error": result.error,
-                }
-            except Exception as e:
+        channel_results: dict[ChannelType, dict] = {}
+        for channel_type, result in zip(request.channels, results):
+            # BaseException: a cancelled send comes back as CancelledError
+            if isinstance(result, BaseException):
                 logger.error(
                     "Channel publish failed",
-                    channel=channel_type.value,
-                    error=str(e),
+                    channel=channel_type,
+                    error=str(result),
                 )
                 channel_results[channel_type] = {
                     "success": False,
-                    "error": str(e),
+                    "error": str(result),
+                }
+            else:
+                channel_results[channel_type] = {
+                    "success": result.success,
+                    "external_id": result.external_id,
+                    "error": result.error,
                 }
 
         # Generate summary
@@ -84,20 +98,20 @@ class DirectPublisher(SocialMediaPublisher):
         media_url: str | None,
     ):
         """Publish to a single channel."""
-        gateway = ChannelGatewayFactory.get_gateway(channel_type)
-
         # Instagram requires media
         if channel_type == ChannelType.INSTAGRAM and not media_url:
-            from ...domain.ports.channel_gateway import DeliveryResult
-
             return DeliveryResult(
                 success=False,
                 channel=channel_type,
                 error="Instagram requires a media URL",
             )
 
-        return await gateway.send(
-            recipient_id="",  # Not used for page posts
-            content=content,
-            media_url=media_url,
-        )
+        gateway = ChannelGatewayFactory.get_gateway(channel_type)
+        # Channel slot first: waiting on a saturated channel must not hold a
+        # publisher slot that sends to other channels could use
+        async with ChannelGatewayFactory.get_semaphore(channel_type), self._sem:
+            return await gateway.send(
+                recipient_id="",  # Not used for page posts
+                content=content,
+                media_url=media_url,
+            )
@@ -11,12 +11,12 @@ import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
-from ...domain.ports import MessageRepository, MessageData
+from ...domain.ports import ChannelOutcome, MessageData
 
 logger = structlog.get_logger()
 
 
-class SqlAlchemyMessageRepository(MessageRepository):
+class SqlAlchemyMessageRepository:
     """
     SQLAlchemy implementation of MessageRepository.
 
@@ -33,97 +33,104 @@ class SqlAlchemyMessageRepository(MessageRepository):
         """
         self._session = session
 
-    async def get_by_id(self, message_id: UUID) -> MessageData | None:
-        """Retrieve a message by its ID."""
+    async def get_by_ids(self, message_ids: list[UUID]) -> dict[UUID, MessageData]:
+        """Retrieve several messages in one query, keyed by ID."""
+        if not message_ids:
+            return {}
+
         result = await self._session.execute(
             text("""
                 SELECT id, content_text, content_media_url, recipient_id, metadata, status
-                FROM messages WHERE id = :id
+                FROM messages WHERE id = ANY(CAST(:ids AS uuid[]))
             """),
-            {"id": str(message_id)},
+            {"ids": message_ids},
         )
-        row = result.fetchone()
-
-        if row:
-            return MessageData(
-                id=UUID(str(row[0])),
-                content=row[1],
-                media_url=row[2],
-                recipient_id=row[3],
-                metadata=row[4] if len(row) > 4 else None,
-                status=row[5] if len(row) > 5 else "pending",
+        return {
+            row["id"]: MessageData(
+                id=row["id"],
+                content=row["content_text"],
+                media_url=row["content_media_url"],
+                recipient_id=row["recipient_id"],
+                metadata=row["metadata"],
+                status=row["status"],
             )
-        return None
-
-    async def update_status(self, message_id: UUID, status: str) -> None:
-        """Update the status of a message."""
-        await self._session.execute(
-            text("""
-                UPDATE messages SET status = :status, updated_at = NOW()
-                WHERE id = :id
-            """),
-            {"id": str(message_id), "status": status},
-        )
-        await self._session.commit()
+            for row in result.mappings()
+        }
 
-        logger.info(
-            "Message status updated",
-            message_id=str(message_id),
-            status=status,
-        )
+    async def bulk_update_status(self, statuses: dict[UUID, str]) -> None:
+        """Update the status of several messages in one statement."""
+        if not statuses:
+            return
 
-    async def mark_channel_delivered(
-        self,
-        message_id: UUID,
-        channel: str,
-        external_id: str | None = None,
-    ) -> None:
-        """Mark a channel delivery as successful."""
         await self._session.execute(
             text("""
-                UPDATE channel_deliveries
-                SET status = 'delivered', delivered_at = NOW(), external_id = :external_id
-                WHERE message_id = :message_id AND channel = :channel
+                UPDATE messages AS m SET status = v.status, updated_at = NOW()
+                FROM unnest(
+                    CAST(:ids AS uuid[]),
+                    CAST(:statuses AS text[])
+                ) AS v(id, status)
+                WHERE m.id = v.id
             """),
-            {
-                "message_id": str(message_id),
-                "channel": channel,
-                "external_id": external_id,
-            },
+            {"ids": list(statuses), "statuses": list(statuses.values())},
         )
         await self._session.commit()
 
-        logger.info(
-            "Channel marked as delivered",
-            message_id=str(message_id),
-            channel=channel,
-            external_id=external_id,
-        )
+        logger.info("Message statuses updated", count=len(statuses))
 
-    async def mark_channel_failed(
+    async def finalize_messages(
         self,
-        message_id: UUID,
-        channel: str,
-        error: str,
+        results: list[tuple[UUID, str, list[ChannelOutcome]]],
     ) -> None:
-        """Mark a channel delivery as failed."""
+        """Record outcomes and statuses for many messages in one CTE statement."""
+        if not results:
+            return
+
+        outcome_rows = [(message_id, o) for message_id, _, outcomes in results for o in outcomes]
         await self._session.execute(
             text("""
-                UPDATE channel_deliveries
-                SET status = 'failed', error = :error
-                WHERE message_id = :message_id AND channel = :channel
+                WITH upd_channels AS (
+                    UPDATE channel_deliveries AS cd
+                    SET status = v.status,
+                        delivered_at = CASE WHEN v.status = 'delivered' THEN NOW()
+                                            ELSE cd.delivered_at END,
+                        external_id = COALESCE(v.external_id, cd.external_id),
+                        error = COALESCE(v.error, cd.error)
+                    FROM unnest(
+                        CAST(:outcome_message_ids AS uuid[]),
+                        CAST(:channels AS text[]),
+                        CAST(:channel_statuses AS text[]),
+                        CAST(:external_ids AS text[]),
+                        CAST(:errors AS text[])
+                    ) AS v(message_id, channel, status, external_id, error)
+                    WHERE cd.message_id = v.message_id AND cd.channel = v.channel
+                    RETURNING 1
+                )
+                UPDATE messages AS m SET status = s.status, updated_at = NOW()
+                FROM unnest(
+                    CAST(:message_ids AS uuid[]),
+                    CAST(:statuses AS text[])
+                ) AS s(id, status)
+                WHERE m.id = s.id
             """),
             {
-                "message_id": str(message_id),
-                "channel": channel,
-                "error": error,
+                "outcome_message_ids": [message_id for message_id, _ in outcome_rows],
+                "channels": [o.channel.value for _, o in outcome_rows],
+                "channel_statuses": [
+                    "delivered" if o.success else "failed" for _, o in outcome_rows
+                ],
+                "external_ids": [o.external_id for _, o in outcome_rows],
+                "errors": [None if o.success else o.error for _, o in outcome_rows],
+                "message_ids": [message_id for message_id, _, _ in results],
+                "statuses": [status for _, status, _ in results],
             },
         )
         await self._session.commit()
 
-        logger.error(
-            "Channel marked as failed",
-            message_id=str(message_id),
-            channel=channel,
-            error=error,
-        )
+        for message_id, status, outcomes in results:
+            logger.info(
+                "Message finalized",
+                message_id=str(message_id),
+                status=status,
+                delivered=[o.channel.value for o in outcomes if o.success],
+                failed=[o.channel.value for o in outcomes if not o.success],
+            )
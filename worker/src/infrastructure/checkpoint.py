@@ -0,0 +1,128 @@
+"""Kinesis shard checkpointing backed by DynamoDB.
+
+Records the last processed sequence number per shard so a restarted
+consumer resumes after it instead of jumping to LATEST. Checkpoints are
+buffered and written with BatchWriteItem to keep DynamoDB calls low.
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import structlog
+from botocore.exceptions import BotoCoreError, ClientError
+
+logger = structlog.get_logger()
+
+# BatchWriteItem accepts at most 25 put requests per call
+MAX_BATCH_ITEMS = 25
+
+
+class KinesisCheckpointer:
+    """
+    Batched DynamoDB checkpoint store for Kinesis shards.
+
+    Table layout: partition key ``stream_name``, sort key ``shard_id``,
+    attribute ``sequence_number``. Only the latest sequence number per
+    shard is kept, so a flush writes one item per shard that advanced.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        table_name: str,
+        stream_name: str,
+        flush_every: int = 25,
+        flush_interval_seconds: float = 5.0,
+    ) -> None:
+        """
+        Initialize checkpointer.
+
+        Args:
+            client: aiobotocore DynamoDB client
+            table_name: Checkpoint table name
+            stream_name: Kinesis stream being consumed
+            flush_every: Flush after this many processed records
+            flush_interval_seconds: Flush when pending checkpoints are this old
+        """
+        self._client = client
+        self._table_name = table_name
+        self._stream_name = stream_name
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval_seconds
+        self._pending: dict[str, str] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def get_checkpoint(self, shard_id: str) -> str | None:
+        """Return the last checkpointed sequence number for a shard."""
+        response = await self._client.get_item(
+            TableName=self._table_name,
+            Key={
+                "stream_name": {"S": self._stream_name},
+                "shard_id": {"S": shard_id},
+            },
+            ConsistentRead=True,
+        )
+        item = response.get("Item")
+        return item["sequence_number"]["S"] if item else None
+
+    async def record(self, shard_id: str, sequence_number: str) -> None:
+        """Record a processed sequence number, flushing when a batch is due."""
+        self._pending[shard_id] = sequence_number
+        self._pending_count += 1
+        if self._pending_count >= self._flush_every:
+            await self.flush()
+        else:
+            await self.flush_if_due()
+
+    async def flush_if_due(self) -> None:
+        """Flush pending checkpoints older than the flush interval."""
+        if self._pending and time.monotonic() - self._last_flush >= self._flush_interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all pending checkpoints."""
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            self._pending_count = 0
+            self._last_flush = time.monotonic()
+            if not pending:
+                return
+
+            items = list(pending.items())
+            for start in range(0, len(items), MAX_BATCH_ITEMS):
+                await self._write_batch(items[start : start + MAX_BATCH_ITEMS])
+
+            logger.debug("Kinesis checkpoints flushed", shards=len(items))
+
+    async def _write_batch(self, items: list[tuple[str, str]]) -> None:
+        """Write one BatchWriteItem request, re-queueing unprocessed items."""
+        try:
+            response = await self._client.batch_write_item(
+                RequestItems={
+                    self._table_name: [
+                        {
+                            "PutRequest": {
+                                "Item": {
+                                    "stream_name": {"S": self._stream_name},
+                                    "shard_id": {"S": shard_id},
+                                    "sequence_number": {"S": sequence_number},
+                                }
+                            }
+                        }
+                        for shard_id, sequence_number in items
+                    ]
+                }
+            )
+        except (BotoCoreError, ClientError) as e:
+            logger.error("Kinesis checkpoint write failed", error=str(e))
+            for shard_id, sequence_number in items:
+                self._pending.setdefault(shard_id, sequence_number)
+            return
+
+        for request in response.get("UnprocessedItems", {}).get(self._table_name, []):
+            item = request["PutRequest"]["Item"]
+            # Keep a newer checkpoint if one arrived while writing
+            self._pending.setdefault(item["shard_id"]["S"], item["sequence_number"]["S"])
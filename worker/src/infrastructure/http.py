@@ -0,0 +1,42 @@
+"""Shared clients for outbound channel APIs.
+
+Every HTTP gateway (Facebook, Instagram, WhatsApp, LinkedIn) shares one
+HTTP/2 client: requests multiplex over pooled keep-alive connections and
+pay the TLS handshake once per host. The SES and SMS gateways likewise
+share one aiobotocore session, so credentials are resolved once.
+"""
+
+import httpx
+from aiobotocore.session import AioSession, get_session
+
+# Global instances
+_http_client: httpx.AsyncClient | None = None
+_aws_session: AioSession | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared outbound HTTP client."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_aws_session() -> AioSession:
+    """Get or create the shared aiobotocore session."""
+    global _aws_session
+    if _aws_session is None:
+        _aws_session = get_session()
+    return _aws_session
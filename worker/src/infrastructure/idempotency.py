@@ -7,40 +7,114 @@ Security: Prevents duplicate message processing which could lead to:
 """
 
 import hashlib
+import heapq
 import time
-from typing import Any
+from array import array
+from collections.abc import Callable
+from datetime import datetime
+from functools import lru_cache
+from math import isnan, nan
+from typing import Any, Literal
 
 import structlog
 
+try:
+    # Non-cryptographic 128-bit hashing for single-node dedup (optional)
+    import xxhash
+except ImportError:
+    xxhash = None
+
 from ..domain.ports import IdempotencyPort, IdempotencyRecord
-from datetime import datetime
 
 logger = structlog.get_logger()
 
 # Default TTL for idempotency keys (24 hours)
 DEFAULT_TTL_SECONDS = 86400
 
+# Idempotency key size in bytes (128-bit digest)
+KEY_SIZE = 16
+
+HashImpl = Literal["blake2b", "xxh3"]
+
+
+def _blake2b_key(data: bytes) -> bytes:
+    """Default key hash: 128-bit BLAKE2b."""
+    return hashlib.blake2b(data, digest_size=KEY_SIZE).digest()
+
+
+def _key_hasher(hash_impl: HashImpl) -> Callable[[bytes], bytes]:
+    """Resolve the KEY_SIZE-byte key hash function for hash_impl."""
+    if hash_impl == "blake2b":
+        return _blake2b_key
+    if hash_impl == "xxh3":
+        if xxhash is None:
+            raise ValueError("hash_impl='xxh3' requires the xxhash package")
+        return xxhash.xxh3_128_digest
+    raise ValueError(f"Unsupported idempotency hash: {hash_impl}")
+
+
+# Placeholder for unset timestamps in the float columns
+_UNSET = nan
+
 
-class InMemoryIdempotencyService(IdempotencyPort):
+@lru_cache(maxsize=1024)
+def _channels_suffix(channels: tuple[str, ...]) -> bytes:
+    """
+    Encoded key suffix for a channel list; the same few sets recur.
+
+    Keyed by the unsorted tuple, so each ordering of a set takes an entry.
+    """
+    return b"|" + ",".join(sorted(channels)).encode()
+
+
+class InMemoryIdempotencyService:
     """
     In-memory implementation of IdempotencyPort.
 
+    Records are stored column-wise: each key maps to a slot index into
+    parallel status / timestamp / result columns, so state transitions
+    update fields in place and IdempotencyRecord instances are only built
+    when returned to callers. Freed slots are reused.
+
     Security: Uses in-memory cache for development, should be replaced
     with DynamoDB or Redis for production to support distributed workers.
     """
 
-    def __init__(self, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        hash_impl: HashImpl = "blake2b",
+        time_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
         """
         Initialize idempotency service.
 
         Args:
             ttl_seconds: Time-to-live for idempotency records
+            hash_impl: Key hash; "xxh3" (xxhash extra) is faster but not
+                cryptographic, so only suits single-node dedup
+            time_fn: Monotonic clock in seconds (injectable for tests)
         """
         self._ttl_seconds = ttl_seconds
-        self._cache: dict[str, IdempotencyRecord] = {}
-        self._expires: dict[str, float] = {}
-
-    def generate_key(self, message_id: str, channels: list[str]) -> str:
+        self._hash = _key_hasher(hash_impl)
+        self._time_fn = time_fn
+        self._slots: dict[bytes, int] = {}
+        self._free_slots: list[int] = []
+        # Per-slot columns; timestamps are time_fn() seconds, NaN when unset
+        self._keys: list[bytes] = []
+        self._status: list[str] = []
+        self._created: array[float] = array("d")
+        self._completed: array[float] = array("d")
+        self._expires: array[float] = array("d")
+        self._result: list[dict[str, Any] | None] = []
+        self._error: list[str | None] = []
+        # (expiry, key) min-heap; entries whose expiry no longer matches
+        # the key's slot (re-locked or released keys) are stale and skipped
+        self._expiry_heap: list[tuple[float, bytes]] = []
+        # Converts time_fn() timestamps to wall-clock ones for returned records
+        self._wall_offset = time.time() - time_fn()
+
+    def generate_key(self, message_id: str, channels: list[str]) -> bytes:
         """
         Generate an idempotency key for a message.
 
@@ -49,14 +123,28 @@ class InMemoryIdempotencyService(IdempotencyPort):
             channels: List of target channels
 
         Returns:
-            SHA256 hash of message_id + sorted channels
+            16-byte digest of message_id + sorted channels
+        """
+        # Channels are sorted for consistent key generation
+        return self._hash(message_id.encode() + _channels_suffix(tuple(channels)))
+
+    def generate_keys(self, items: list[tuple[str, list[str]]]) -> list[bytes]:
+        """
+        Generate idempotency keys for a batch of messages.
+
+        Args:
+            items: (message_id, channels) per message
+
+        Returns:
+            Keys matching generate_key, in input order
         """
-        # Sort channels for consistent key generation
-        channels_str = ",".join(sorted(channels))
-        key_input = f"{message_id}:{channels_str}"
-        return hashlib.sha256(key_input.encode()).hexdigest()
+        key_hash = self._hash
+        return [
+            key_hash(message_id.encode() + _channels_suffix(tuple(channels)))
+            for message_id, channels in items
+        ]
 
-    def check_and_lock(self, key: str) -> IdempotencyRecord | None:
+    def check_and_lock(self, key: bytes) -> IdempotencyRecord | None:
         """
         Check if a message has been processed and lock for processing.
 
@@ -67,54 +155,73 @@ class InMemoryIdempotencyService(IdempotencyPort):
             Existing record if already processed/processing, None if new
         """
         self._cleanup_expired()
+        return self._check_and_lock(key)
 
-        existing = self._cache.get(key)
+    def check_and_lock_many(self, keys: list[bytes]) -> list[IdempotencyRecord | None]:
+        """
+        Check and lock several messages in one call.
+
+        Expired records are swept once for the whole batch.
 
-        if existing:
-            if existing.status == "completed":
+        Args:
+            keys: Idempotency keys
+
+        Returns:
+            Existing record or None (newly locked) per key, in order
+        """
+        self._cleanup_expired()
+        return [self._check_and_lock(key) for key in keys]
+
+    def _check_and_lock(self, key: bytes) -> IdempotencyRecord | None:
+        """Check and lock a single key without sweeping expired records."""
+        now = self._time_fn()
+        slot = self._slots.get(key)
+
+        if slot is not None:
+            status = self._status[slot]
+            if status == "completed":
                 logger.info(
                     "Message already processed (idempotent)",
-                    idempotency_key=key[:16],
+                    idempotency_key=key[:8].hex(),
                 )
-                return existing
+                return self._record(slot)
 
-            if existing.status == "processing":
+            if status == "processing":
                 # Check if processing has timed out (5 minutes)
-                if (datetime.now() - existing.created_at).total_seconds() > 300:
+                if now - self._created[slot] > 300:
                     logger.warning(
                         "Processing timeout, allowing retry",
-                        idempotency_key=key[:16],
+                        idempotency_key=key[:8].hex(),
                     )
                     # Allow retry by falling through
                 else:
                     logger.info(
                         "Message currently being processed",
-                        idempotency_key=key[:16],
+                        idempotency_key=key[:8].hex(),
                     )
-                    return existing
+                    return self._record(slot)
+        else:
+            slot = self._allocate(key)
 
         # Lock for processing
-        now = datetime.now()
-        record = IdempotencyRecord(
-            key=key,
-            status="processing",
-            created_at=now,
-            completed_at=None,
-            result=None,
-            error=None,
-        )
-        self._cache[key] = record
-        self._expires[key] = time.time() + self._ttl_seconds
+        expires_at = now + self._ttl_seconds
+        self._status[slot] = "processing"
+        self._created[slot] = now
+        self._completed[slot] = _UNSET
+        self._expires[slot] = expires_at
+        self._result[slot] = None
+        self._error[slot] = None
+        heapq.heappush(self._expiry_heap, (expires_at, key))
 
         logger.debug(
             "Locked message for processing",
-            idempotency_key=key[:16],
+            idempotency_key=key[:8].hex(),
         )
         return None
 
     def mark_completed(
         self,
-        key: str,
+        key: bytes,
         result: dict[str, Any],
     ) -> None:
         """
@@ -124,22 +231,18 @@ class InMemoryIdempotencyService(IdempotencyPort):
             key: The idempotency key
             result: The processing result to cache
         """
-        if key in self._cache:
-            record = self._cache[key]
-            self._cache[key] = IdempotencyRecord(
-                key=record.key,
-                status="completed",
-                created_at=record.created_at,
-                completed_at=datetime.now(),
-                result=result,
-                error=None,
-            )
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._status[slot] = "completed"
+            self._completed[slot] = self._time_fn()
+            self._result[slot] = result
+            self._error[slot] = None
             logger.debug(
                 "Marked message as completed",
-                idempotency_key=key[:16],
+                idempotency_key=key[:8].hex(),
             )
 
-    def mark_failed(self, key: str, error: str) -> None:
+    def mark_failed(self, key: bytes, error: str) -> None:
         """
         Mark a message as failed (allows retry).
 
@@ -147,47 +250,90 @@ class InMemoryIdempotencyService(IdempotencyPort):
             key: The idempotency key
             error: The error message
         """
-        if key in self._cache:
-            record = self._cache[key]
-            self._cache[key] = IdempotencyRecord(
-                key=record.key,
-                status="failed",
-                created_at=record.created_at,
-                completed_at=datetime.now(),
-                result=None,
-                error=error,
-            )
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._status[slot] = "failed"
+            self._completed[slot] = self._time_fn()
+            self._result[slot] = None
+            self._error[slot] = error
             logger.debug(
                 "Marked message as failed",
-                idempotency_key=key[:16],
+                idempotency_key=key[:8].hex(),
                 error=error,
             )
 
-    def release_lock(self, key: str) -> None:
+    def release_lock(self, key: bytes) -> None:
         """
         Release a processing lock without marking complete.
 
         Args:
             key: The idempotency key
         """
-        if key in self._cache:
-            del self._cache[key]
-            if key in self._expires:
-                del self._expires[key]
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._free(key, slot)
             logger.debug(
                 "Released processing lock",
-                idempotency_key=key[:16],
+                idempotency_key=key[:8].hex(),
             )
 
+    def _allocate(self, key: bytes) -> int:
+        """Assign a slot to key, reusing a freed one when available."""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._keys[slot] = key
+        else:
+            slot = len(self._keys)
+            self._keys.append(key)
+            self._status.append("")
+            self._created.append(_UNSET)
+            self._completed.append(_UNSET)
+            self._expires.append(_UNSET)
+            self._result.append(None)
+            self._error.append(None)
+        self._slots[key] = slot
+        return slot
+
+    def _free(self, key: bytes, slot: int) -> None:
+        """Drop key and return its slot to the free list."""
+        del self._slots[key]
+        self._keys[slot] = b""
+        self._expires[slot] = _UNSET
+        self._result[slot] = None
+        self._error[slot] = None
+        self._free_slots.append(slot)
+
+    def _record(self, slot: int) -> IdempotencyRecord:
+        """Materialize the record stored in slot."""
+        completed = self._completed[slot]
+        return IdempotencyRecord(
+            key=self._keys[slot],
+            status=self._status[slot],
+            created_at=datetime.fromtimestamp(self._created[slot] + self._wall_offset),
+            completed_at=(
+                None if isnan(completed) else datetime.fromtimestamp(completed + self._wall_offset)
+            ),
+            result=self._result[slot],
+            error=self._error[slot],
+        )
+
     def _cleanup_expired(self) -> None:
-        """Remove expired records from cache."""
-        now = time.time()
-        expired = [k for k, v in self._expires.items() if v < now]
-        for key in expired:
-            del self._cache[key]
-            del self._expires[key]
-        if expired:
-            logger.debug("Cleaned up expired idempotency records", count=len(expired))
+        """Remove expired records, popping only expired heap heads."""
+        now = self._time_fn()
+        heap = self._expiry_heap
+        heappop = heapq.heappop
+        slots_get = self._slots.get
+        expires = self._expires
+        count = 0
+        while heap and heap[0][0] < now:
+            expires_at, key = heappop(heap)
+            slot = slots_get(key)
+            if slot is None or expires[slot] != expires_at:
+                continue  # Stale entry
+            self._free(key, slot)
+            count += 1
+        if count:
+            logger.debug("Cleaned up expired idempotency records", count=count)
 
 
 # Global instance
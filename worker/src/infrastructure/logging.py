@@ -12,7 +12,9 @@ import logging
 import sys
 import time
 from contextvars import ContextVar
+from typing import Any
 
+import orjson
 import structlog
 
 # Context variable for message correlation
@@ -41,7 +43,7 @@ def configure_logging(service_name: str) -> None:
             structlog.processors.TimeStamper(fmt="iso"),
             _add_service_name(service_name),
             _add_correlation_id,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
@@ -49,6 +51,11 @@ def configure_logging(service_name: str) -> None:
     )
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize log events with orjson (str output for the stdlib handler)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+
+
 def _add_service_name(service_name: str):
     """Processor to add service name to all logs."""
 
@@ -87,21 +94,24 @@ class Timer:
         logger.info("Operation completed", duration_ms=t.duration_ms)
     """
 
+    __slots__ = ("_end", "_start")
+
     def __init__(self):
-        self._start: float = 0
-        self._end: float = 0
+        # Integer nanoseconds; converted only when duration_ms is read
+        self._start: int = 0
+        self._end: int = 0
 
     def __enter__(self) -> "Timer":
-        self._start = time.perf_counter()
+        self._start = time.perf_counter_ns()
         return self
 
     def __exit__(self, *args) -> None:
-        self._end = time.perf_counter()
+        self._end = time.perf_counter_ns()
 
     @property
     def duration_ms(self) -> float:
         """Duration in milliseconds, rounded to 2 decimal places."""
-        return round((self._end - self._start) * 1000, 2)
+        return round((self._end - self._start) / 1_000_000, 2)
 
 
 def sanitize_for_logging(value: str, visible_chars: int = 8) -> str:
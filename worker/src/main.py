@@ -4,13 +4,21 @@ import signal
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+try:
+    # libuv-based event loop (not available on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from .config import settings
 from .consumer import KinesisConsumer
 from .infrastructure.adapters import (
     AgentPublisher,
+    ChannelGatewayFactory,
     DirectPublisher,
     SqlAlchemyMessageRepository,
 )
+from .infrastructure.http import close_http_client
 from .infrastructure.idempotency import get_idempotency_service
 from .infrastructure.logging import configure_logging
 from .processor import MessageProcessor
@@ -43,6 +51,7 @@ async def main() -> None:
         # Wire up dependencies (Composition Root)
         message_repository = SqlAlchemyMessageRepository(session)
         publisher = create_publisher()
+        ChannelGatewayFactory.warmup()
         idempotency = get_idempotency_service()
 
         processor = MessageProcessor(
@@ -54,19 +63,31 @@ async def main() -> None:
             idempotency=idempotency,
         )
 
-        # Handle shutdown signals
-        loop = asyncio.get_event_loop()
+        # Handle shutdown signals: set an event instead of spawning a task per signal
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, lambda: asyncio.create_task(consumer.stop()))
+            loop.add_signal_handler(sig, stop_event.set)
+
+        async def stop_on_signal() -> None:
+            await stop_event.wait()
+            await consumer.stop()
 
         try:
-            await consumer.start()
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(stop_on_signal())
+                await consumer.start()
+                # Consumer finished on its own; release the waiter
+                stop_event.set()
         except asyncio.CancelledError:
             logger.info("Worker cancelled")
         finally:
+            await close_http_client()
             await engine.dispose()
             logger.info("Worker shutdown complete")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -8,12 +8,19 @@ Following hexagonal architecture, this class depends on ports (abstractions)
 rather than concrete implementations.
 """
 
+import asyncio
 from uuid import UUID
 
 import structlog
 
 from .application.services import MessageDeliveryService
-from .domain.ports import MessageRepository, SocialMediaPublisher
+from .domain.ports import (
+    ChannelOutcome,
+    MessageData,
+    MessageRepository,
+    PublishResult,
+    SocialMediaPublisher,
+)
 
 logger = structlog.get_logger()
 
@@ -46,71 +53,99 @@ class MessageProcessor:
         self._repository = message_repository
         self._delivery_service = MessageDeliveryService(publisher)
 
-    async def process_scheduled_message(
-        self,
-        message_id: str,
-        channels: list[str],
-    ) -> None:
+    async def process_scheduled_messages(self, batch: list[tuple[str, list[str], str]]) -> None:
         """
-        Process a scheduled message and deliver to all channels.
+        Process several scheduled messages together.
+
+        Messages are fetched, marked processing and finalized with one
+        statement each for the whole batch; deliveries run concurrently.
 
         Args:
-            message_id: UUID of the message to process
-            channels: List of channel names to deliver to
+            batch: (message_id, channels, correlation_id) per message
         """
-        logger.info(
-            "Processing message",
-            message_id=message_id,
-            channels=channels,
+        logger.info("Processing message batch", size=len(batch))
+
+        ids = [UUID(message_id) for message_id, _, _ in batch]
+        messages = await self._repository.get_by_ids(ids)
+        found: list[tuple[MessageData, list[str], str]] = []
+        for mid, (message_id, channels, correlation_id) in zip(ids, batch):
+            message = messages.get(mid)
+            if message is None:
+                logger.error(
+                    "Message not found",
+                    message_id=message_id,
+                    correlation_id=correlation_id,
+                )
+                continue
+            found.append((message, channels, correlation_id))
+
+        if not found:
+            return
+
+        await self._repository.bulk_update_status({m.id: "processing" for m, _, _ in found})
+
+        results = await asyncio.gather(
+            *[self._deliver(*item) for item in found],
+            return_exceptions=True,
         )
 
-        # Fetch message from database via repository
-        message = await self._repository.get_by_id(UUID(message_id))
-        if not message:
-            logger.error("Message not found", message_id=message_id)
-            return
+        final: list[tuple[UUID, str, list[ChannelOutcome]]] = []
+        for (message, channels, correlation_id), result in zip(found, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Message processing failed",
+                    message_id=str(message.id),
+                    correlation_id=correlation_id,
+                    error=str(result),
+                )
+                final.append((message.id, "failed", []))
+            else:
+                outcomes, status = _final_state(result, channels)
+                final.append((message.id, status, outcomes))
 
-        # Mark as processing
-        await self._repository.update_status(UUID(message_id), "processing")
+        await self._repository.finalize_messages(final)
 
-        try:
-            # Deliver using the application service
-            result = await self._delivery_service.deliver(
+    async def _deliver(
+        self,
+        message: MessageData,
+        channels: list[str],
+        correlation_id: str,
+    ) -> PublishResult:
+        """Deliver one message of a batch, with its IDs bound for its logs."""
+        # Each gathered delivery runs in its own task context, so the
+        # bindings stay local to this message
+        with structlog.contextvars.bound_contextvars(
+            message_id=str(message.id),
+            correlation_id=correlation_id,
+        ):
+            return await self._delivery_service.deliver(
                 content=message.content,
                 channels=channels,
                 media_url=message.media_url,
                 metadata=message.metadata,
             )
 
-            # Update channel delivery statuses based on results
-            for channel_type, channel_result in result.channel_results.items():
-                channel_name = channel_type.value
-                if channel_result.get("success"):
-                    await self._repository.mark_channel_delivered(
-                        UUID(message_id),
-                        channel_name,
-                        channel_result.get("external_id"),
-                    )
-                else:
-                    await self._repository.mark_channel_failed(
-                        UUID(message_id),
-                        channel_name,
-                        channel_result.get("error", "Unknown error"),
-                    )
-
-            # Update overall message status
-            success_count = sum(1 for r in result.channel_results.values() if r.get("success"))
-            if success_count == len(channels):
-                await self._repository.update_status(UUID(message_id), "delivered")
-            elif success_count > 0:
-                await self._repository.update_status(UUID(message_id), "partial")
-            else:
-                await self._repository.update_status(UUID(message_id), "failed")
 
-        except Exception as e:
-            logger.error(
-                "Message processing failed",
-                message_id=message_id,
-                error=str(e),
-            )
-            await self._repository.update_status(UUID(message_id), "failed")
+def _final_state(
+    result: PublishResult,
+    channels: list[str],
+) -> tuple[list[ChannelOutcome], str]:
+    """Derive per-channel outcomes and the overall message status."""
+    outcomes = [
+        ChannelOutcome(
+            channel=channel_type,
+            success=bool(channel_result.get("success")),
+            external_id=channel_result.get("external_id"),
+            error=channel_result.get("error", "Unknown error"),
+        )
+        for channel_type, channel_result in result.channel_results.items()
+    ]
+
+    success_count = sum(1 for o in outcomes if o.success)
+    if success_count == len(channels):
+        status = "delivered"
+    elif success_count > 0:
+        status = "partial"
+    else:
+        status = "failed"
+    return outcomes, status
@@ -0,0 +1,148 @@
+"""Tests for the AI agent publisher."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.domain.ports import ChannelType, DeliveryResult, PublishRequest
+from src.infrastructure.adapters.agent_publisher import AgentPublisher
+
+
+class FakeAgent:
+    """Stands in for a Strands agent; its one turn submits the given plan."""
+
+    def __init__(self, plan: dict | None, in_flight: asyncio.Barrier | None = None) -> None:
+        self.messages: list[dict] = []
+        self._plan = plan
+        self._in_flight = in_flight
+
+    async def invoke_async(self, prompt: str) -> SimpleNamespace:
+        self.messages.append({"role": "user", "content": [{"text": prompt}]})
+        if self._in_flight is not None:
+            # Every turn sharing the barrier must be in flight at once
+            await asyncio.wait_for(self._in_flight.wait(), timeout=1)
+        if self._plan is not None:
+            tool_use = {"name": "plan_posts", "input": {"plan": self._plan}}
+            self.messages.append({"role": "assistant", "content": [{"toolUse": tool_use}]})
+        message = {"role": "assistant", "content": [{"text": "Done"}]}
+        self.messages.append(message)
+        return SimpleNamespace(message=message, metrics=None)
+
+
+class TestAgentPublisher:
+    """Tests for planning and publishing with a fresh agent per turn."""
+
+    @pytest.fixture
+    def gateway(self):
+        gateway = AsyncMock()
+        gateway.send.return_value = DeliveryResult(success=True, external_id="post-1")
+        with patch(
+            "src.infrastructure.adapters.agent_publisher.ChannelGatewayFactory.get_gateway",
+            return_value=gateway,
+        ):
+            yield gateway
+
+    @pytest.fixture
+    def agents(self):
+        """Agents handed out per planning turn, in order; tests append them."""
+        agents: list[FakeAgent] = []
+        built = iter(agents)
+        with (
+            patch("src.infrastructure.adapters.agent_publisher._build_model"),
+            patch(
+                "src.infrastructure.adapters.agent_publisher._build_agent",
+                side_effect=lambda model: next(built),
+            ),
+        ):
+            yield agents
+
+    @pytest.mark.asyncio
+    async def test_turn_without_plan_does_not_reuse_previous_plan(self, gateway, agents) -> None:
+        """A turn that never calls plan_posts must not publish an earlier message's plan."""
+        agents += [FakeAgent({"facebook": "Congrats Alice!"}), FakeAgent(None)]
+        publisher = AgentPublisher()
+
+        await publisher.publish(
+            PublishRequest(content="Alice passed SAA", channels=(ChannelType.FACEBOOK,))
+        )
+        await publisher.publish(
+            PublishRequest(content="Bob passed DVA", channels=(ChannelType.FACEBOOK,))
+        )
+
+        sent = [call.kwargs["content"] for call in gateway.send.await_args_list]
+        assert sent == ["Congrats Alice!"]
+        # Each turn has its own history
+        assert "Alice" not in str(agents[1].messages)
+
+    @pytest.mark.asyncio
+    async def test_planning_turns_run_concurrently(self, gateway, agents) -> None:
+        """Publishers share the model, not an agent, so turns don't wait on each other."""
+        in_flight = asyncio.Barrier(2)
+        agents += [
+            FakeAgent({"facebook": "Congrats Alice!"}, in_flight),
+            FakeAgent({"facebook": "Congrats Bob!"}, in_flight),
+        ]
+
+        results = await asyncio.gather(
+            AgentPublisher().publish(
+                PublishRequest(content="Alice passed SAA", channels=(ChannelType.FACEBOOK,))
+            ),
+            AgentPublisher().publish(
+                PublishRequest(content="Bob passed DVA", channels=(ChannelType.FACEBOOK,))
+            ),
+        )
+
+        assert all(r.channel_results[ChannelType.FACEBOOK]["success"] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_channel_missing_from_plan_fails(self, gateway, agents) -> None:
+        """Channels the agent left out are reported failed, not sent the raw input."""
+        agents.append(FakeAgent({"linkedin": "Congratulations to Bob & team"}))
+        publisher = AgentPublisher()
+
+        result = await publisher.publish(
+            PublishRequest(
+                content="Bob & team passed <DVA>",
+                channels=(ChannelType.LINKEDIN, ChannelType.FACEBOOK),
+            )
+        )
+
+        assert result.channel_results[ChannelType.LINKEDIN]["success"] is True
+        assert result.channel_results[ChannelType.FACEBOOK]["success"] is False
+        gateway.send.assert_awaited_once()
+        assert gateway.send.await_args.kwargs["content"] == "Congratulations to Bob & team"
+
+    @pytest.mark.asyncio
+    async def test_instagram_without_media_fails(self, gateway, agents) -> None:
+        """Instagram needs media even when the agent planned a post for it."""
+        agents.append(FakeAgent({"instagram": "Certified! #AWSCertified"}))
+        publisher = AgentPublisher()
+
+        result = await publisher.publish(
+            PublishRequest(content="Bob passed DVA", channels=(ChannelType.INSTAGRAM,))
+        )
+
+        assert result.channel_results[ChannelType.INSTAGRAM]["success"] is False
+        assert "media" in result.channel_results[ChannelType.INSTAGRAM]["error"]
+        gateway.send.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_recipient_channels_fail_without_sending(self, gateway, agents) -> None:
+        """Email and SMS need a recipient the agent path doesn't have, even if planned."""
+        agents.append(FakeAgent({"email": "Congrats!", "sms": "Congrats!", "facebook": "Yay"}))
+        publisher = AgentPublisher()
+
+        result = await publisher.publish(
+            PublishRequest(
+                content="Bob passed DVA",
+                channels=(ChannelType.EMAIL, ChannelType.SMS, ChannelType.FACEBOOK),
+            )
+        )
+
+        assert result.channel_results[ChannelType.EMAIL]["success"] is False
+        assert result.channel_results[ChannelType.SMS]["success"] is False
+        assert "recipient" in result.channel_results[ChannelType.EMAIL]["error"]
+        gateway.send.assert_awaited_once()
+        assert gateway.send.await_args.kwargs["content"] == "Yay"
@@ -1,17 +1,37 @@
-import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from contextlib import asynccontextmanager, nullcontext
+from unittest.mock import AsyncMock, patch
+
 import httpx
+import orjson
+import pytest
+from aiobotocore.session import get_session
+from botocore.stub import Stubber
 
 from src.channels import (
-    WhatsAppGateway,
+    DeliveryResult,
+    EmailGateway,
     FacebookGateway,
     InstagramGateway,
-    EmailGateway,
+    LinkedInGateway,
     SmsGateway,
-    DeliveryResult,
+    WhatsAppGateway,
 )
+from src.infrastructure.http import close_http_client, get_http_client
+
 
+@asynccontextmanager
+async def stub_aws_client(gateway, service):
+    """Route a gateway's AWS calls to a botocore-stubbed client; yields the Stubber."""
+    session = get_session()
+    session.set_credentials("test", "test")
+    async with session.create_client(service, region_name="us-east-1") as client:
+        with patch.object(gateway, "_session") as mock_session, Stubber(client) as stubber:
+            mock_session.create_client.return_value = nullcontext(client)
+            yield stubber
+            stubber.assert_no_pending_responses()
 
+
+@pytest.mark.respx(base_url="https://graph.facebook.com")
 class TestWhatsAppGateway:
     @pytest.fixture
     def gateway(self):
@@ -21,63 +41,105 @@ class TestWhatsAppGateway:
         )
 
     @pytest.mark.asyncio
-    async def test_send_text_message_success(self, gateway):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"messages": [{"id": "wamid.123"}]}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
-            
-            result = await gateway.send(
-                recipient_id="+1234567890",
-                content="Hello!",
-            )
-        
+    async def test_send_text_message_success(self, gateway, respx_mock):
+        respx_mock.post("/v18.0/123456789/messages").mock(
+            return_value=httpx.Response(200, json={"messages": [{"id": "wamid.123"}]})
+        )
+
+        result = await gateway.send(
+            recipient_id="+1234567890",
+            content="Hello!",
+        )
+
         assert result.success is True
         assert result.external_id == "wamid.123"
 
     @pytest.mark.asyncio
-    async def test_send_with_media(self, gateway):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"messages": [{"id": "wamid.456"}]}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
-            
-            result = await gateway.send(
-                recipient_id="+1234567890",
-                content="Check this!",
-                media_url="https://example.com/image.jpg",
-            )
-        
+    async def test_send_with_media(self, gateway, respx_mock):
+        route = respx_mock.post("/v18.0/123456789/messages").mock(
+            return_value=httpx.Response(200, json={"messages": [{"id": "wamid.456"}]})
+        )
+
+        result = await gateway.send(
+            recipient_id="+1234567890",
+            content="Check this!",
+            media_url="https://example.com/image.jpg",
+        )
+
         assert result.success is True
+        assert orjson.loads(route.calls.last.request.content)["type"] == "image"
 
     @pytest.mark.asyncio
-    async def test_send_api_error(self, gateway):
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                side_effect=httpx.HTTPStatusError(
-                    "Error",
-                    request=MagicMock(),
-                    response=MagicMock(status_code=401),
-                )
-            )
-            
-            result = await gateway.send(
-                recipient_id="+1234567890",
-                content="Hello!",
-            )
-        
+    async def test_send_api_error(self, gateway, respx_mock):
+        route = respx_mock.post("/v18.0/123456789/messages").mock(return_value=httpx.Response(401))
+
+        result = await gateway.send(
+            recipient_id="+1234567890",
+            content="Hello!",
+        )
+
         assert result.success is False
         assert "401" in result.error
+        # Not a throttling response, so not retried
+        assert route.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_throttled_send_retried(self, gateway, respx_mock):
+        route = respx_mock.post("/v18.0/123456789/messages").mock(
+            side_effect=[
+                httpx.Response(429),
+                httpx.Response(400, json={"error": {"message": "Rate limit hit"}}),
+                httpx.Response(200, json={"messages": [{"id": "wamid.123"}]}),
+            ]
+        )
+
+        with patch("src.channels.retry.asyncio.sleep", AsyncMock()) as sleep:
+            result = await gateway.send(recipient_id="+1234567890", content="Hello!")
+
+        assert result.success is True
+        assert route.call_count == 3
+        assert [call.args[0] for call in sleep.await_args_list] == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("recipients_count", [1, 10, 100])
+    async def test_send_many(self, gateway, respx_mock, recipients_count):
+        route = respx_mock.post("/v18.0/123456789/messages").mock(
+            return_value=httpx.Response(200, json={"messages": [{"id": "wamid.789"}]})
+        )
+        recipients = [f"+1555000{i:04d}" for i in range(recipients_count)]
+
+        results = await gateway.send_many(recipients, "Hello all!", concurrency=8)
 
+        assert len(results) == recipients_count
+        assert all(r.success for r in results)
+        assert route.call_count == recipients_count
+
+    def test_auth_header_precomputed(self, gateway):
+        assert gateway._headers["Authorization"] == "Bearer test-token"
+
+    @pytest.fixture
+    async def http_client(self):
+        """The shared HTTP client, closed afterwards so it doesn't leak into other tests."""
+        client = get_http_client()
+        yield client
+        await close_http_client()
+
+    def test_gateways_share_http_client(self, http_client):
+        whatsapp = WhatsAppGateway("token", "123", client=http_client)
+        facebook = FacebookGateway("token", "page123", client=http_client)
+        linkedin = LinkedInGateway("token", "org123", client=http_client)
+
+        assert whatsapp._client is facebook._client is linkedin._client is get_http_client()
+
+    @pytest.mark.asyncio
+    async def test_close_http_client_resets_shared_client(self, http_client):
+        await close_http_client()
+
+        assert http_client.is_closed
+        assert get_http_client() is not http_client
+
+
+@pytest.mark.respx(base_url="https://graph.facebook.com")
 class TestFacebookGateway:
     @pytest.fixture
     def gateway(self):
@@ -87,25 +149,21 @@ class TestFacebookGateway:
         )
 
     @pytest.mark.asyncio
-    async def test_post_text_success(self, gateway):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"id": "post_123"}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
-            
-            result = await gateway.send(
-                recipient_id="",  # Not used for page posts
-                content="Hello Facebook!",
-            )
-        
+    async def test_post_text_success(self, gateway, respx_mock):
+        respx_mock.post("/v18.0/page123/feed").mock(
+            return_value=httpx.Response(200, json={"id": "post_123"})
+        )
+
+        result = await gateway.send(
+            recipient_id="",  # Not used for page posts
+            content="Hello Facebook!",
+        )
+
         assert result.success is True
         assert result.external_id == "post_123"
 
 
+@pytest.mark.respx(base_url="https://graph.facebook.com")
 class TestInstagramGateway:
     @pytest.fixture
     def gateway(self):
@@ -121,10 +179,55 @@ class TestInstagramGateway:
             content="No media",
             media_url=None,
         )
-        
+
         assert result.success is False
         assert "require" in result.error.lower()
 
+    @pytest.mark.asyncio
+    async def test_retry_reuses_media_container(self, gateway, respx_mock):
+        container = respx_mock.post("/v18.0/ig123/media").respond(json={"id": "container_1"})
+        publish = respx_mock.post("/v18.0/ig123/media_publish").mock(
+            side_effect=[httpx.Response(500), httpx.Response(200, json={"id": "ig_post_1"})]
+        )
+
+        first = await gateway.send(
+            recipient_id="",
+            content="Certified!",
+            media_url="https://example.com/badge.png",
+        )
+        second = await gateway.send(
+            recipient_id="",
+            content="Certified!",
+            media_url="https://example.com/badge.png",
+        )
+
+        assert first.success is False
+        assert second.success is True
+        assert second.external_id == "ig_post_1"
+        # Only the publish call is repeated on retry
+        assert container.call_count == 1
+        assert publish.call_count == 2
+        assert b"creation_id=container_1" in publish.calls.last.request.content
+
+    @pytest.mark.asyncio
+    async def test_container_cache_is_bounded(self, gateway, respx_mock):
+        respx_mock.post("/v18.0/ig123/media").respond(json={"id": "container_1"})
+        respx_mock.post("/v18.0/ig123/media_publish").respond(500)
+
+        with patch("src.channels.instagram.CONTAINER_CACHE_SIZE", 2):
+            for caption in ("First", "Second", "Third"):
+                await gateway.send(
+                    recipient_id="",
+                    content=caption,
+                    media_url="https://example.com/badge.png",
+                )
+
+        # Oldest unpublished container evicted once the cap is reached
+        assert list(gateway._container_cache) == [
+            gateway._container_key("https://example.com/badge.png", caption)
+            for caption in ("Second", "Third")
+        ]
+
 
 class TestEmailGateway:
     @pytest.fixture
@@ -136,21 +239,44 @@ class TestEmailGateway:
 
     @pytest.mark.asyncio
     async def test_send_email_success(self, gateway):
-        with patch.object(gateway, "_session") as mock_session:
-            mock_client = AsyncMock()
-            mock_client.send_email = AsyncMock(
-                return_value={"MessageId": "ses-msg-123"}
-            )
-            mock_session.create_client.return_value.__aenter__.return_value = mock_client
-            
+        async with stub_aws_client(gateway, "ses") as stubber:
+            stubber.add_response("send_email", {"MessageId": "ses-msg-123"})
+
             result = await gateway.send(
                 recipient_id="user@example.com",
                 content="Hello via email!",
             )
-        
+
         assert result.success is True
         assert result.external_id == "ses-msg-123"
 
+    @pytest.mark.asyncio
+    async def test_send_email_escapes_html(self, gateway):
+        content = "<script>alert('x')</script>"
+        async with stub_aws_client(gateway, "ses") as stubber:
+            stubber.add_response(
+                "send_email",
+                {"MessageId": "ses-msg-789"},
+                expected_params={
+                    "Source": "noreply@example.com",
+                    "Destination": {"ToAddresses": ["user@example.com"]},
+                    "Message": {
+                        "Subject": {"Data": "New Message", "Charset": "UTF-8"},
+                        "Body": {
+                            "Html": {
+                                "Data": "<p>&lt;script&gt;alert('x')&lt;/script&gt;</p>",
+                                "Charset": "UTF-8",
+                            },
+                            "Text": {"Data": content, "Charset": "UTF-8"},
+                        },
+                    },
+                },
+            )
+
+            result = await gateway.send(recipient_id="user@example.com", content=content)
+
+        assert result.success is True
+
 
 class TestSmsGateway:
     @pytest.fixture
@@ -162,33 +288,57 @@ class TestSmsGateway:
 
     @pytest.mark.asyncio
     async def test_send_sms_success(self, gateway):
-        with patch.object(gateway, "_session") as mock_session:
-            mock_client = AsyncMock()
-            mock_client.publish = AsyncMock(
-                return_value={"MessageId": "sns-msg-456"}
+        async with stub_aws_client(gateway, "sns") as stubber:
+            stubber.add_response(
+                "publish",
+                {"MessageId": "sns-msg-456"},
+                expected_params={
+                    "PhoneNumber": "+1234567890",
+                    "Message": "Hello via SMS!",
+                    "MessageAttributes": {
+                        "AWS.SNS.SMS.SenderID": {"DataType": "String", "StringValue": "MyApp"}
+                    },
+                },
             )
-            mock_session.create_client.return_value.__aenter__.return_value = mock_client
-            
+
             result = await gateway.send(
                 recipient_id="+1234567890",
                 content="Hello via SMS!",
             )
-        
+
         assert result.success is True
         assert result.external_id == "sns-msg-456"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("recipients_count", [1, 10, 100])
+    async def test_send_many_shares_one_client(self, gateway, recipients_count):
+        async with stub_aws_client(gateway, "sns") as stubber:
+            for _ in range(recipients_count):
+                stubber.add_response("publish", {"MessageId": "sns-msg-789"})
+
+            recipients = [f"+1555000{i:04d}" for i in range(recipients_count)]
+            results = await gateway.send_many(recipients, "Hello all!")
+            gateway._session.create_client.assert_called_once()
+
+        assert [r.success for r in results] == [True] * recipients_count
+
 
 class TestDeliveryResult:
     def test_success_result(self):
         result = DeliveryResult(success=True, external_id="123")
-        
+
         assert result.success is True
         assert result.external_id == "123"
         assert result.error is None
 
     def test_failure_result(self):
         result = DeliveryResult(success=False, error="API error")
-        
+
         assert result.success is False
         assert result.external_id is None
         assert result.error == "API error"
+
+    def test_single_class_across_import_paths(self):
+        from src.domain.ports import DeliveryResult as PortDeliveryResult
+
+        assert DeliveryResult is PortDeliveryResult
@@ -0,0 +1,68 @@
+"""Tests for the Kinesis consumer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.consumer import KinesisConsumer
+
+
+def make_record(sequence_number: str) -> dict:
+    return {"SequenceNumber": sequence_number, "Data": b"{}"}
+
+
+class TestDrainShardQueue:
+    """Tests for batch processing and checkpointing of queued records."""
+
+    @pytest.fixture
+    def consumer(self) -> KinesisConsumer:
+        consumer = KinesisConsumer(processor=MagicMock(), idempotency=MagicMock())
+        consumer._checkpointer = AsyncMock()
+        return consumer
+
+    async def drain(self, consumer: KinesisConsumer, batches: list[list[dict]]) -> None:
+        """Queue each batch, then drain it before queueing the next."""
+        queue: asyncio.Queue[dict | None] = asyncio.Queue()
+        drainer = asyncio.create_task(consumer._drain_shard_queue("shard-1", queue))
+        for batch in batches:
+            for record in batch:
+                queue.put_nowait(record)
+            await asyncio.sleep(0)
+        queue.put_nowait(None)
+        await drainer
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_processed_records(self, consumer) -> None:
+        with patch.object(consumer, "_process_records", AsyncMock(return_value=True)):
+            await self.drain(consumer, [[make_record("1"), make_record("2")]])
+
+        recorded = [call.args for call in consumer._checkpointer.record.await_args_list]
+        assert recorded == [("shard-1", "1"), ("shard-1", "2")]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_not_checkpointed(self, consumer) -> None:
+        """A failed batch, and everything after it, stays replayable."""
+        process = AsyncMock(side_effect=[True, False, True])
+        with patch.object(consumer, "_process_records", process):
+            await self.drain(
+                consumer,
+                [[make_record("1")], [make_record("2")], [make_record("3")]],
+            )
+
+        assert process.await_count == 3
+        recorded = [call.args for call in consumer._checkpointer.record.await_args_list]
+        assert recorded == [("shard-1", "1")]
+
+    @pytest.mark.asyncio
+    async def test_process_records_reports_failure(self, consumer) -> None:
+        scheduled = ({"message_id": "m1", "channels": ["facebook"]}, "corr-1")
+        with (
+            patch.object(consumer, "_parse_record", return_value=scheduled),
+            patch.object(
+                consumer,
+                "_handle_scheduled_messages",
+                AsyncMock(side_effect=RuntimeError("db down")),
+            ),
+        ):
+            assert await consumer._process_records([make_record("1")]) is False
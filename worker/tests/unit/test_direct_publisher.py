@@ -0,0 +1,69 @@
+"""Tests for the direct publisher."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.domain.ports import ChannelType, DeliveryResult, PublishRequest
+from src.infrastructure.adapters.channel_gateway_factory import ChannelGatewayFactory
+from src.infrastructure.adapters.direct_publisher import DirectPublisher
+
+
+class TestDirectPublisher:
+    """Tests for concurrent, bounded channel sends."""
+
+    @pytest.fixture
+    def gateway(self):
+        gateway = AsyncMock()
+        gateway.send.return_value = DeliveryResult(success=True, external_id="post-1")
+        with patch.object(ChannelGatewayFactory, "get_gateway", return_value=gateway):
+            yield gateway
+        ChannelGatewayFactory.reset()
+
+    @pytest.mark.asyncio
+    async def test_saturated_channel_does_not_block_other_channels(self, gateway) -> None:
+        """Waiting for a busy channel must not hold one of the publisher's slots."""
+        publisher = DirectPublisher(max_concurrency=1)
+        facebook = ChannelGatewayFactory.get_semaphore(ChannelType.FACEBOOK)
+        while not facebook.locked():
+            await facebook.acquire()
+
+        blocked = asyncio.create_task(
+            publisher.publish(PublishRequest(content="Hi", channels=(ChannelType.FACEBOOK,)))
+        )
+        await asyncio.sleep(0)
+        result = await asyncio.wait_for(
+            publisher.publish(PublishRequest(content="Hi", channels=(ChannelType.LINKEDIN,))),
+            timeout=1,
+        )
+
+        assert result.channel_results[ChannelType.LINKEDIN]["success"] is True
+        assert not blocked.done()
+        blocked.cancel()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_send_is_reported_failed(self, gateway) -> None:
+        gateway.send.side_effect = asyncio.CancelledError()
+
+        result = await DirectPublisher().publish(
+            PublishRequest(content="Hi", channels=(ChannelType.FACEBOOK,))
+        )
+
+        assert result.channel_results[ChannelType.FACEBOOK]["success"] is False
+
+
+class TestChannelSemaphores:
+    """Tests for the per-channel semaphores shared by publishers."""
+
+    def test_new_event_loop_gets_fresh_semaphores(self) -> None:
+        async def get_semaphore() -> asyncio.Semaphore:
+            return ChannelGatewayFactory.get_semaphore(ChannelType.FACEBOOK)
+
+        try:
+            first = asyncio.run(get_semaphore())
+            second = asyncio.run(get_semaphore())
+        finally:
+            ChannelGatewayFactory.reset()
+
+        assert first is not second
@@ -1,7 +1,6 @@
 """Tests for idempotency service."""
 
-import time
-
+import pytest
 
 from src.infrastructure.idempotency import InMemoryIdempotencyService
 
@@ -12,23 +11,36 @@ class TestIdempotencyService:
     def setup_method(self) -> None:
         self.service = InMemoryIdempotencyService(ttl_seconds=60)
 
-    def test_generate_key_consistent(self) -> None:
-        """Same inputs should generate same key."""
-        key1 = self.service.generate_key("msg-123", ["facebook", "linkedin"])
-        key2 = self.service.generate_key("msg-123", ["facebook", "linkedin"])
-        assert key1 == key2
-
-    def test_generate_key_channel_order_independent(self) -> None:
-        """Channel order should not affect key."""
-        key1 = self.service.generate_key("msg-123", ["facebook", "linkedin"])
-        key2 = self.service.generate_key("msg-123", ["linkedin", "facebook"])
-        assert key1 == key2
-
-    def test_generate_key_different_messages(self) -> None:
-        """Different messages should have different keys."""
-        key1 = self.service.generate_key("msg-123", ["facebook"])
-        key2 = self.service.generate_key("msg-456", ["facebook"])
-        assert key1 != key2
+    @pytest.mark.parametrize(
+        ("a", "b", "equal"),
+        [
+            (("msg-123", ["facebook", "linkedin"]), ("msg-123", ["facebook", "linkedin"]), True),
+            (("msg-123", ["facebook", "linkedin"]), ("msg-123", ["linkedin", "facebook"]), True),
+            (("msg-123", ["facebook"]), ("msg-456", ["facebook"]), False),
+        ],
+        ids=["consistent", "channel-order-independent", "different-messages"],
+    )
+    def test_generate_key(self, a, b, equal) -> None:
+        """Keys depend on the message and channel set, not channel order."""
+        assert (self.service.generate_key(*a) == self.service.generate_key(*b)) is equal
+
+    def test_generate_keys_matches_generate_key(self) -> None:
+        """Batch key generation should match single calls, in order."""
+        items = [("msg-1", ["linkedin", "facebook"]), ("msg-2", ["sms"])]
+        keys = self.service.generate_keys(items)
+
+        assert keys == [self.service.generate_key(m, c) for m, c in items]
+
+    def test_unknown_hash_impl_rejected(self) -> None:
+        """Unsupported key hashes should fail at construction."""
+        with pytest.raises(ValueError):
+            InMemoryIdempotencyService(hash_impl="crc32c")
+
+    def test_generate_key_fixed_size_binary(self) -> None:
+        """Keys should be 16-byte binary digests."""
+        key = self.service.generate_key("msg-123", ["facebook", "linkedin"])
+        assert isinstance(key, bytes)
+        assert len(key) == 16
 
     def test_check_and_lock_new_message(self) -> None:
         """New message should return None and be locked."""
@@ -48,6 +60,19 @@ class TestIdempotencyService:
         assert result is not None
         assert result.status == "processing"
 
+    def test_check_and_lock_many(self) -> None:
+        """Batch lock should return per-key results in order."""
+        locked = self.service.generate_key("msg-batch-1", ["facebook"])
+        new = self.service.generate_key("msg-batch-2", ["facebook"])
+        self.service.check_and_lock(locked)
+
+        results = self.service.check_and_lock_many([locked, new])
+
+        assert results[0] is not None
+        assert results[0].status == "processing"
+        assert results[1] is None
+        assert self.service.check_and_lock(new) is not None
+
     def test_mark_completed(self) -> None:
         """Completed message should be cached."""
         key = self.service.generate_key("msg-complete", ["facebook"])
@@ -86,16 +111,33 @@ class TestIdempotencyService:
 
     def test_expired_records_cleaned(self) -> None:
         """Expired records should be cleaned up."""
-        # Use very short TTL
-        service = InMemoryIdempotencyService(ttl_seconds=0)
+        now = [0.0]
+        service = InMemoryIdempotencyService(ttl_seconds=1, time_fn=lambda: now[0])
         key = self.service.generate_key("msg-expire", ["facebook"])
 
         service.check_and_lock(key)
         service.mark_completed(key, {"success": True})
 
-        # Wait for expiry
-        time.sleep(0.1)
+        # Advance past expiry
+        now[0] += 2
 
         # Should be cleaned up on next check
         result = service.check_and_lock(key)
         assert result is None  # Expired, so treated as new
+
+    def test_relocked_key_outlives_stale_expiry(self) -> None:
+        """A released then re-locked key keeps its new expiry."""
+        now = [0.0]
+        service = InMemoryIdempotencyService(ttl_seconds=60, time_fn=lambda: now[0])
+        key = service.generate_key("msg-relock", ["facebook"])
+
+        service.check_and_lock(key)
+        service.release_lock(key)
+        now[0] += 30
+        service.check_and_lock(key)
+
+        # Past the first lock's expiry, before the second's
+        now[0] += 31
+        result = service.check_and_lock(key)
+        assert result is not None
+        assert result.status == "processing"
@@ -0,0 +1,51 @@
+"""Tests for the message processor."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+import structlog
+
+from src.domain.ports import MessageData, PublishResult
+from src.processor import MessageProcessor
+
+
+class RecordingPublisher:
+    """Publisher that records the log context each publish runs under."""
+
+    def __init__(self) -> None:
+        self.contexts: dict[str, dict] = {}
+
+    async def publish(self, request) -> PublishResult:
+        context = structlog.contextvars.get_contextvars()
+        self.contexts[context["message_id"]] = context
+        return PublishResult(
+            channel_results={c: {"success": True} for c in request.channels},
+        )
+
+
+class TestProcessScheduledMessages:
+    """Tests for batched message processing."""
+
+    @pytest.mark.asyncio
+    async def test_correlation_id_bound_per_message(self) -> None:
+        """Each delivery logs under its own record's correlation ID."""
+        first, second = uuid4(), uuid4()
+        repository = AsyncMock()
+        repository.get_by_ids.return_value = {
+            mid: MessageData(id=mid, content="Congrats!") for mid in (first, second)
+        }
+        publisher = RecordingPublisher()
+        processor = MessageProcessor(repository, publisher)
+
+        await processor.process_scheduled_messages(
+            [
+                (str(first), ["facebook"], "corr-1"),
+                (str(second), ["linkedin"], "corr-2"),
+            ]
+        )
+
+        assert publisher.contexts[str(first)]["correlation_id"] == "corr-1"
+        assert publisher.contexts[str(second)]["correlation_id"] == "corr-2"
+        # Bindings don't leak out of the per-message deliveries
+        assert "correlation_id" not in structlog.contextvars.get_contextvars()